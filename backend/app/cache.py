@@ -0,0 +1,268 @@
+"""
+Content-addressed cache for PDF extraction results.
+
+Parsing a PDF is expensive (usually one or more LLM round-trips), and the
+same bytes are often processed more than once. This module stores each
+parser's (pages, summary) output on disk, keyed by the SHA-256 of the PDF
+content together with the parser type, model name and prompt version, so
+a repeat extraction costs a single streaming hash of the file.
+
+Entries are stored as {cache_dir}/{key[:2]}/{key}.json. The cache can be
+capped in size: reads refresh an entry's mtime, and once the cache grows
+past its limit the least recently used entries are deleted.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from .models import Page
+
+logger = logging.getLogger(__name__)
+
+# Size of each read when hashing a PDF
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# An over-limit cache is trimmed to this fraction of its limit, so sweeps
+# (which stat every entry) run once per batch of writes, not per write
+CACHE_SWEEP_TARGET_RATIO = 0.9
+
+
+class CachedExtraction(BaseModel):
+    """
+    On-disk representation of a cached extraction.
+
+    Entries are re-validated against this model on read, so a corrupt or
+    outdated file is treated as a cache miss instead of leaking bad data.
+    """
+    pages: List[Page] = Field(..., description="Extracted pages")
+    summary: Optional[str] = Field(None, description="Document summary")
+    model: str = Field(..., description="Model that produced the extraction")
+    prompt_version: str = Field(..., description="Prompt version used")
+    created_utc: str = Field(..., description="ISO 8601 timestamp of creation")
+
+
+# Serializes entries straight to JSON bytes for writing
+ENTRY_ADAPTER = TypeAdapter(CachedExtraction)
+
+
+def hash_file(path: str) -> "hashlib._Hash":
+    """
+    Hash a file's content with SHA-256, reading it in fixed-size chunks.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        SHA-256 hash object, which callers may keep updating
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest
+
+
+def make_cache_key(
+    content_hash: "hashlib._Hash",
+    parser_type: str,
+    model_name: str,
+    prompt_version: str
+) -> str:
+    """
+    Build the cache key for a PDF and parser configuration.
+
+    Each configuration part is appended to a copy of the file's content
+    hash with an 8-byte big-endian length prefix, so that different part
+    boundaries can never produce the same input to the hash. The content
+    hash itself is left untouched, so callers can still use its digest.
+
+    Args:
+        content_hash: SHA-256 hash of the PDF content, from hash_file()
+        parser_type: Parser type value (e.g. 'gemini')
+        model_name: Model identifier used by the parser
+        prompt_version: Version of the parser's prompts
+
+    Returns:
+        Hex SHA-256 digest identifying the extraction
+    """
+    digest = content_hash.copy()
+
+    for part in (parser_type, model_name, prompt_version):
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Disk-backed cache of parser outputs keyed by make_cache_key().
+
+    Cache failures never fail a parse: unreadable entries are treated as
+    misses and write errors are logged and ignored.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cache entries are stored
+            max_bytes: Size limit for all entries together; 0 means
+                unlimited
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+        # Running estimate of the cache size (None until the first sweep).
+        # Other processes share the directory, so sweeps re-measure it.
+        self._approx_bytes: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Tuple[List[Dict[str, str]], Optional[str]]]:
+        """
+        Look up a cached extraction.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Tuple of (pages, summary), or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            entry = CachedExtraction.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        if self.max_bytes:
+            # Mark the entry as recently used for the LRU sweep
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        return [page.model_dump() for page in entry.pages], entry.summary
+
+    def put(
+        self,
+        key: str,
+        pages: List[Dict[str, str]],
+        summary: Optional[str],
+        model: str,
+        prompt_version: str
+    ) -> None:
+        """
+        Store an extraction.
+
+        The entry is written to a temporary file and renamed into place,
+        so concurrent readers never see a partially written entry.
+
+        Args:
+            key: Cache key from make_cache_key()
+            pages: Extracted pages
+            summary: Document summary
+            model: Model that produced the extraction
+            prompt_version: Prompt version used
+        """
+        path = self._entry_path(key)
+        entry = CachedExtraction(
+            pages=pages,
+            summary=summary,
+            model=model,
+            prompt_version=prompt_version,
+            created_utc=datetime.now(timezone.utc).isoformat()
+        )
+
+        data = ENTRY_ADAPTER.dump_json(entry)
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=path.parent, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                f.write(data)
+            os.replace(tmp_name, path)
+            logger.debug(f"Cached extraction {key}")
+        except OSError as e:
+            if tmp_name:
+                Path(tmp_name).unlink(missing_ok=True)
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            return
+
+        if self.max_bytes:
+            self._account(len(data))
+
+    def _account(self, added_bytes: int) -> None:
+        """
+        Add a write to the size estimate, sweeping once it passes the limit.
+
+        Args:
+            added_bytes: Size of the entry just written
+        """
+        with self._size_lock:
+            if self._approx_bytes is not None:
+                self._approx_bytes += added_bytes
+                if self._approx_bytes <= self.max_bytes:
+                    return
+            self._approx_bytes = self._sweep()
+
+    def _sweep(self) -> int:
+        """
+        Delete least recently used entries until the cache fits its limit.
+
+        Entries are ordered by mtime, which get() refreshes on every hit.
+        Orphaned entries (e.g. from an older prompt version) are never read
+        again, so they age out first.
+
+        Returns:
+            Size of the cache after the sweep, in bytes
+        """
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return total
+
+        target = int(self.max_bytes * CACHE_SWEEP_TARGET_RATIO)
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to evict cache entry {path}: {e}")
+                continue
+            total -= size
+            removed += 1
+
+        logger.info(f"Evicted {removed} cache entries ({total} bytes remain)")
+        return total
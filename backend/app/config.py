@@ -11,9 +11,10 @@ Environment variables can be set in:
 """
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from pathlib import Path
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,13 +31,31 @@ class Settings(BaseSettings):
         mistral_api_key: API key for Mistral AI.
         upload_dir: Directory for storing uploaded files.
         max_file_size_mb: Maximum allowed file size in megabytes.
-        allowed_extensions: List of allowed file extensions.
+        allowed_extensions: Tuple of allowed file extensions.
         redis_url: URL for Redis connection.
         redis_stream_name: Name of the Redis stream for job queue.
         redis_consumer_group: Name of the Redis consumer group.
-        redis_consumer_name: Name of this Redis consumer.
+        redis_consumer_name: Name of this Redis consumer; empty means
+            '{hostname}-{pid}', which is unique per worker process.
         redis_result_ttl_seconds: TTL for job results in Redis.
-        cors_origins: List of allowed CORS origins for frontend access.
+        redis_max_connections: Size of the shared Redis connection pool.
+        cors_origins: Tuple of allowed CORS origins for frontend access.
+        extraction_cache_enabled: Whether to cache parser outputs on disk.
+        extraction_cache_dir: Directory for cached parser outputs.
+        extraction_cache_max_mb: Size limit of the extraction cache; least
+            recently used entries are evicted past it (0 means unlimited).
+        ocr_concurrency: Maximum concurrent OCR requests per document.
+        worker_block_time_ms: How long a worker blocks waiting for jobs
+            (0 blocks indefinitely).
+        worker_concurrency: Jobs a worker process runs at the same time.
+        worker_claim_idle_ms: Idle time after which a pending job is taken
+            over from its (presumably dead) consumer; must exceed the
+            longest job.
+        worker_claim_interval_seconds: Seconds between sweeps for such jobs.
+        worker_max_deliveries: Deliveries after which a reclaimed job is
+            marked FAILED instead of being run again.
+        worker_noack: Read jobs with NOACK, skipping the pending list and
+            acknowledgements; a job is lost if its worker dies mid-job.
     """
     
     # Application metadata
@@ -56,22 +75,42 @@ class Settings(BaseSettings):
     # File Upload Configuration
     upload_dir: str = "./uploads"
     max_file_size_mb: int = 25
-    allowed_extensions: list[str] = [".pdf"]
+    allowed_extensions: tuple[str, ...] = (".pdf",)
     
     # Redis Configuration (for job queue)
     redis_url: str = "redis://localhost:6379"
     redis_stream_name: str = "pdf-jobs"
     redis_consumer_group: str = "pdf-workers"
-    redis_consumer_name: str = "worker-1"
+    redis_consumer_name: str = ""
     redis_result_ttl_seconds: int = 3600
+    redis_max_connections: int = 50
+    
+    # Extraction Cache (parser outputs keyed by PDF content)
+    extraction_cache_enabled: bool = True
+    extraction_cache_dir: str = "./cache"
+    extraction_cache_max_mb: int = 1024
+    
+    # Worker Configuration
+    worker_block_time_ms: int = 30000
+    worker_concurrency: int = 4
+    worker_claim_idle_ms: int = 600000
+    worker_claim_interval_seconds: int = 60
+    worker_max_deliveries: int = 3
+    worker_noack: bool = False
+    
+    # OCR Configuration (Mistral parser)
+    ocr_concurrency: int = 8
     
     # CORS Configuration (for frontend)
-    cors_origins: list[str] = [
+    cors_origins: tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:8080",
         "http://localhost:5173",  # Vite default
         "https://pdf-processor-sage-xi.vercel.app",  # Production frontend on Vercel
-    ]
+    )
+    
+    # Set once the upload directory has been created
+    _upload_dir_ready: bool = PrivateAttr(default=False)
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -91,24 +130,47 @@ class Settings(BaseSettings):
             "mistral": bool(self.mistral_api_key),
         }
     
-    def get_max_file_size_bytes(self) -> int:
-        """Get maximum file size in bytes.
+    @cached_property
+    def max_file_size_bytes(self) -> int:
+        """Maximum file size in bytes, computed once per settings instance.
         
         Returns:
             Maximum file size in bytes.
         """
         return self.max_file_size_mb * 1024 * 1024
     
+    @cached_property
+    def allowed_extensions_set(self) -> frozenset[str]:
+        """Lower-cased allowed extensions for O(1) membership checks.
+        
+        Returns:
+            Frozen set of allowed file extensions.
+        """
+        return frozenset(ext.lower() for ext in self.allowed_extensions)
+    
+    @cached_property
+    def upload_path(self) -> Path:
+        """Upload directory as a Path, built once per settings instance.
+        
+        Returns:
+            Path of the upload directory.
+        """
+        return Path(self.upload_dir)
+    
     def ensure_upload_dir(self) -> None:
         """Create upload directory if it doesn't exist.
         
         This should be called on application startup to ensure
-        the upload directory is available.
+        the upload directory is available. Only the first call per
+        settings instance touches the filesystem.
         """
+        if self._upload_dir_ready:
+            return
         os.makedirs(self.upload_dir, exist_ok=True)
+        self._upload_dir_ready = True
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance.
     
@@ -120,3 +182,7 @@ def get_settings() -> Settings:
         Singleton Settings instance.
     """
     return Settings()
+
+
+# Module-level singleton so importers share one parsed Settings instance
+settings: Settings = get_settings()
@@ -0,0 +1,54 @@
+"""
+OpenAPI examples for the API response models.
+
+Kept out of models.py so they are only imported when a JSON schema is
+generated (e.g. on the first /openapi.json request), not at import time.
+"""
+
+from typing import Any, Dict
+
+
+EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "UploadResponse": {
+        "job_id": "550e8400e29b41d4a716446655440000",
+        "status": "pending",
+        "filename": "contract.pdf",
+        "parser": "gemini",
+        "timestamp": "2024-01-15T10:30:00Z"
+    },
+    "JobStatusResponse": {
+        "job_id": "550e8400e29b41d4a716446655440000",
+        "status": "processing",
+        "filename": "contract.pdf",
+        "parser": "gemini",
+        "timestamp": "2024-01-15T10:30:00Z",
+        "error": None
+    },
+    "ProcessingResult": {
+        "job_id": "550e8400e29b41d4a716446655440000",
+        "status": "completed",
+        "filename": "contract.pdf",
+        "parser": "gemini",
+        "pages": [
+            {"page": "1", "content": "This is a sample contract..."},
+            {"page": "2", "content": "Terms and conditions..."}
+        ],
+        "summary": "This document outlines a service agreement between two parties...",
+        "error": None,
+        "timestamp": "2024-01-15T10:30:00Z",
+        "processing_time_seconds": 12.5
+    },
+    "JobListResponse": {
+        "jobs": [
+            {
+                "job_id": "550e8400e29b41d4a716446655440000",
+                "status": "completed",
+                "filename": "contract.pdf",
+                "parser": "gemini",
+                "timestamp": "2024-01-15T10:30:00Z",
+                "error": None
+            }
+        ],
+        "total": 1
+    },
+}
@@ -8,16 +8,22 @@ This module provides the REST API endpoints for:
 - Listing all jobs
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import time
 import uuid
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Query
+import aiofiles
+from fastapi import Depends, FastAPI, File, UploadFile, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .models import (
@@ -26,10 +32,12 @@ from .models import (
     UploadResponse,
     JobStatusResponse,
     ProcessingResult,
-    JobListResponse
+    JobListResponse,
+    STATUS_BY_VALUE,
+    PARSER_BY_VALUE
 )
-from .config import get_settings
-from .redis_client import get_redis_client
+from .config import settings
+from .redis_client import RedisClient, get_redis_client
 
 # Configure logging
 logging.basicConfig(
@@ -38,40 +46,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize settings and Redis client
-settings = get_settings()
-redis_client = get_redis_client()
-
-# Create FastAPI app
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    description="Async PDF processing API with multiple parser options"
-)
-
-# Add CORS middleware for frontend access
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
+# ========== Application Lifespan ==========
 
-# ========== Startup & Shutdown Events ==========
-
-@app.on_event("startup")
-async def startup_event():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    Initialize application on startup.
+    Run one-time startup work, then clean up on shutdown.
 
+    On startup:
+    - Connect to Redis and share the client via app.state.redis
     - Create upload directory
-    - Create Redis consumer group
+    - Create Redis consumer group (a no-op if it already exists)
+    - Index any jobs created before the job index existed (once per
+      Redis database, guarded by a marker key)
     - Validate API keys
     """
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
 
+    # One client (and connection pool) shared by every request
+    redis_client = get_redis_client()
+    app.state.redis = redis_client
+
     # Ensure upload directory exists
     settings.ensure_upload_dir()
     logger.info(f"Upload directory: {settings.upload_dir}")
@@ -82,30 +78,84 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to create consumer group: {e}")
 
+    # Backfill the job index used for listing jobs
+    try:
+        redis_client.rebuild_job_index()
+    except Exception as e:
+        logger.error(f"Failed to rebuild job index: {e}")
+
     # Check API key availability
     api_keys = settings.validate_api_keys()
     logger.info(f"Available parsers: {[k for k, v in api_keys.items() if v]}")
     if not any(api_keys.values()):
         logger.warning("No API keys configured! Only PyPDF basic extraction will work.")
 
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on shutdown."""
     logger.info("Shutting down application")
+    redis_client.close()
+
+
+# Create FastAPI app
+app = FastAPI(
+    title=settings.app_name,
+    version=settings.app_version,
+    description="Async PDF processing API with multiple parser options",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Add CORS middleware for frontend access
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+# ========== Dependencies ==========
+
+async def get_redis(request: Request) -> RedisClient:
+    """
+    Get the Redis client created at startup.
+
+    Endpoints that only talk to Redis are plain functions, so FastAPI runs
+    them in its threadpool and the blocking client never stalls the event
+    loop. Async endpoints hand their Redis calls to run_in_threadpool.
+
+    Returns:
+        Shared RedisClient instance
+    """
+    return request.app.state.redis
 
 
 # ========== Health Check Endpoint ==========
 
+# Orchestrators poll /health every few seconds; reuse a recent PING result so
+# bursts of probes collapse into at most one Redis call per TTL window.
+HEALTH_CACHE_TTL_SECONDS = 1.0
+_last_health_check: Tuple[float, bool] = (float("-inf"), False)
+
+
 @app.get("/health")
-async def health_check():
+def health_check(redis_client: RedisClient = Depends(get_redis)):
     """
     Health check endpoint.
 
+    The Redis check is cached for HEALTH_CACHE_TTL_SECONDS.
+
     Returns:
         Status of the application and its dependencies
     """
-    redis_healthy = redis_client.health_check()
+    global _last_health_check
+
+    checked_at, redis_healthy = _last_health_check
+    now = time.monotonic()
+    if now - checked_at >= HEALTH_CACHE_TTL_SECONDS:
+        redis_healthy = redis_client.health_check()
+        _last_health_check = (now, redis_healthy)
 
     return {
         "status": "healthy" if redis_healthy else "degraded",
@@ -116,10 +166,78 @@ async def health_check():
 
 # ========== Upload Endpoint ==========
 
+# Size of each read from the incoming upload stream
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+async def remove_file(file_path: Path) -> bool:
+    """
+    Delete a file without blocking the event loop.
+
+    Args:
+        file_path: Path of the file to delete
+
+    Returns:
+        True if the file was deleted, False if it did not exist
+    """
+    try:
+        await asyncio.to_thread(file_path.unlink)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+async def save_upload(
+    file: UploadFile,
+    file_path: Path,
+    max_size_bytes: int
+) -> Tuple[int, str]:
+    """
+    Stream an uploaded file to disk in fixed-size chunks.
+
+    Only one chunk is held in memory at a time, and the upload is aborted
+    as soon as it grows past the size limit. The SHA-256 digest of the
+    content is computed in the same pass so duplicates can be detected
+    without re-reading the file.
+
+    Args:
+        file: Incoming upload
+        file_path: Destination path on disk
+        max_size_bytes: Maximum allowed file size in bytes
+
+    Returns:
+        Tuple of (bytes written, hex SHA-256 digest)
+
+    Raises:
+        HTTPException: If the file exceeds the maximum size
+    """
+    total = 0
+    digest = hashlib.sha256()
+    try:
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > max_size_bytes:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"File {file.filename} exceeds maximum size of "
+                               f"{settings.max_file_size_mb}MB"
+                    )
+                digest.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        # Don't leave partial uploads behind
+        await remove_file(file_path)
+        raise
+
+    return total, digest.hexdigest()
+
+
 @app.post("/api/upload", response_model=List[UploadResponse])
 async def upload_files(
     files: List[UploadFile] = File(...),
-    parser: ParserType = Query(ParserType.PYPDF, description="Parser type to use")
+    parser: ParserType = Query(ParserType.PYPDF, description="Parser type to use"),
+    redis_client: RedisClient = Depends(get_redis)
 ):
     """
     Upload one or more PDF files for processing.
@@ -136,85 +254,135 @@ async def upload_files(
     """
     logger.info(f"Received {len(files)} file(s) for upload with parser: {parser.value}")
 
-    responses = []
-    max_size_bytes = settings.get_max_file_size_bytes()
+    # Settings lookups are loop-invariant, so resolve them once per request
+    allowed_extensions = settings.allowed_extensions_set
+    max_size_bytes = settings.max_file_size_bytes
+    upload_path = settings.upload_path
 
+    # Validate every file name before writing anything to disk
     for file in files:
-        try:
-            # Validate file
-            if not file.filename.endswith('.pdf'):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File {file.filename} is not a PDF"
-                )
-
-            # Read file content
-            content = await file.read()
-            file_size_mb = len(content) / (1024 * 1024)
+        if Path(file.filename).suffix.lower() not in allowed_extensions:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File {file.filename} is not a PDF"
+            )
 
-            if len(content) > max_size_bytes:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File {file.filename} exceeds maximum size of "
-                           f"{settings.max_file_size_mb}MB (actual: {file_size_mb:.2f}MB)"
-                )
+    saved = []  # (filename, job_id, file_path, digest) per stored file
 
+    try:
+        for file in files:
             # Generate unique job ID
-            job_id = str(uuid.uuid4())
-            timestamp = datetime.utcnow().isoformat()
+            job_id = uuid.uuid4().hex
 
-            # Save file to upload directory
-            file_path = Path(settings.upload_dir) / f"{job_id}.pdf"
-            with open(file_path, "wb") as f:
-                f.write(content)
+            # Stream file to upload directory
+            file_path = upload_path / f"{job_id}.pdf"
+            file_size, digest = await save_upload(file, file_path, max_size_bytes)
+            saved.append((file.filename, job_id, file_path, digest))
 
             logger.info(
                 f"Saved file {file.filename} as {file_path} "
-                f"({file_size_mb:.2f}MB)"
+                f"({file_size / (1024 * 1024):.2f}MB)"
             )
 
-            # Create job hash in Redis
-            redis_client.create_job_hash(
-                job_id=job_id,
-                filename=file.filename,
-                parser=parser,
-                status=JobStatus.PENDING
-            )
-
-            # Add job to processing queue (Redis Stream)
-            redis_client.add_job_to_stream(
-                job_id=job_id,
-                filename=file.filename,
-                parser=parser
-            )
+        # Look up previously processed content in a single round-trip
+        existing_jobs = await run_in_threadpool(
+            redis_client.find_jobs_by_digest,
+            [digest for *_, digest in saved],
+            parser
+        )
 
-            # Add to response list
+        timestamp = datetime.now(timezone.utc).isoformat()
+        responses = []
+        new_jobs = []
+        queued = {}  # digest -> job, to catch duplicates within this request
+
+        for (filename, job_id, file_path, digest), existing in zip(saved, existing_jobs):
+            existing = existing or queued.get(digest)
+            if existing:
+                # Reuse the existing job instead of processing the same bytes
+                # again; the response still names the file as submitted
+                await remove_file(file_path)
+                responses.append(UploadResponse(
+                    job_id=existing["job_id"],
+                    status=STATUS_BY_VALUE[existing["status"]],
+                    filename=filename,
+                    parser=parser,
+                    timestamp=existing["timestamp"]
+                ))
+                logger.info(
+                    f"File {filename} matches existing job "
+                    f"{existing['job_id']}, skipping re-processing"
+                )
+                continue
+
+            job = {
+                "job_id": job_id,
+                "filename": filename,
+                "digest": digest,
+                "status": JobStatus.PENDING.value,
+                "timestamp": timestamp
+            }
+            queued[digest] = job
+            new_jobs.append(job)
             responses.append(UploadResponse(
                 job_id=job_id,
                 status=JobStatus.PENDING,
-                filename=file.filename,
+                filename=filename,
                 parser=parser,
                 timestamp=timestamp
             ))
 
-            logger.info(f"Job {job_id} created and queued for processing")
+        # Create job hashes and queue entries in a single round-trip
+        await run_in_threadpool(redis_client.enqueue_jobs, new_jobs, parser)
+
+    except Exception as e:
+        # Nothing was queued, so don't leave orphaned uploads behind
+        for *_, file_path, _ in saved:
+            await remove_file(file_path)
 
-        except HTTPException:
+        if isinstance(e, HTTPException):
             raise
-        except Exception as e:
-            logger.error(f"Failed to process upload for {file.filename}: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to process {file.filename}: {str(e)}"
-            )
+        logger.error(f"Failed to process upload: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to process upload: {str(e)}"
+        )
+
+    for job in new_jobs:
+        logger.info(f"Job {job['job_id']} created and queued for processing")
 
     return responses
 
 
 # ========== Status Check Endpoint ==========
 
+
+def build_job_status_response(job_id: str, job_data: dict) -> JobStatusResponse:
+    """
+    Build a status response from a job hash without re-validating it.
+
+    Job hashes are written by this application from validated models,
+    so model_construct is used to skip per-field validation.
+
+    Args:
+        job_id: Unique job identifier
+        job_data: Job metadata hash from Redis
+
+    Returns:
+        JobStatusResponse for the job
+    """
+    return JobStatusResponse.model_construct(
+        job_id=job_id,
+        status=STATUS_BY_VALUE[job_data["status"]],
+        filename=job_data["filename"],
+        parser=PARSER_BY_VALUE[job_data["parser"]],
+        timestamp=job_data["timestamp"],
+        error=job_data.get("error") or None
+    )
+
+
 @app.get("/api/status/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(job_id: str):
+def get_job_status(job_id: str, redis_client: RedisClient = Depends(get_redis)):
     """
     Get the current status of a processing job.
 
@@ -238,14 +406,7 @@ async def get_job_status(job_id: str):
                 detail=f"Job {job_id} not found"
             )
 
-        return JobStatusResponse(
-            job_id=job_id,
-            status=JobStatus(job_data["status"]),
-            filename=job_data["filename"],
-            parser=ParserType(job_data["parser"]),
-            timestamp=job_data["timestamp"],
-            error=job_data.get("error") or None
-        )
+        return build_job_status_response(job_id, job_data)
 
     except HTTPException:
         raise
@@ -260,7 +421,7 @@ async def get_job_status(job_id: str):
 # ========== Result Retrieval Endpoint ==========
 
 @app.get("/api/result/{job_id}", response_model=ProcessingResult)
-async def get_job_result(job_id: str):
+def get_job_result(job_id: str, redis_client: RedisClient = Depends(get_redis)):
     """
     Get the processing result for a completed job.
 
@@ -276,8 +437,8 @@ async def get_job_result(job_id: str):
     logger.debug(f"Retrieving result for job {job_id}")
 
     try:
-        # First check job status
-        job_data = redis_client.get_job_status(job_id)
+        # Fetch status and result together in a single round-trip
+        job_data, result_json = redis_client.get_status_and_result(job_id)
 
         if not job_data:
             raise HTTPException(
@@ -285,7 +446,7 @@ async def get_job_result(job_id: str):
                 detail=f"Job {job_id} not found"
             )
 
-        status = JobStatus(job_data["status"])
+        status = STATUS_BY_VALUE[job_data["status"]]
 
         # Check if job is completed
         if status == JobStatus.PENDING:
@@ -301,20 +462,19 @@ async def get_job_result(job_id: str):
         elif status == JobStatus.FAILED:
             raise HTTPException(
                 status_code=500,
-                detail=f"Job failed: {job_data.get('error', 'Unknown error')}"
+                detail=f"Job failed: {job_data['error'] or 'Unknown error'}"
             )
 
-        # Get result from Redis
-        result = redis_client.get_result(job_id)
-
-        if not result:
+        if not result_json:
             raise HTTPException(
                 status_code=404,
                 detail="Job result not found or expired"
             )
 
+        # The worker validated the result before storing it, so return the
+        # stored JSON as-is instead of parsing and re-serializing it
         logger.info(f"Retrieved result for job {job_id}")
-        return result
+        return Response(content=result_json, media_type="application/json")
 
     except HTTPException:
         raise
@@ -329,7 +489,7 @@ async def get_job_result(job_id: str):
 # ========== Job List Endpoint ==========
 
 @app.get("/api/jobs", response_model=JobListResponse)
-async def list_all_jobs():
+def list_all_jobs(redis_client: RedisClient = Depends(get_redis)):
     """
     List all jobs in the system.
 
@@ -342,14 +502,7 @@ async def list_all_jobs():
         jobs_data = redis_client.get_all_jobs()
 
         jobs = [
-            JobStatusResponse(
-                job_id=job["job_id"],
-                status=JobStatus(job["status"]),
-                filename=job["filename"],
-                parser=ParserType(job["parser"]),
-                timestamp=job["timestamp"],
-                error=job.get("error") or None
-            )
+            build_job_status_response(job["job_id"], job)
             for job in jobs_data
         ]
 
@@ -369,7 +522,7 @@ async def list_all_jobs():
 # ========== Delete Job Endpoint (Utility) ==========
 
 @app.delete("/api/jobs/{job_id}")
-async def delete_job(job_id: str):
+async def delete_job(job_id: str, redis_client: RedisClient = Depends(get_redis)):
     """
     Delete a job and its result from the system.
 
@@ -385,7 +538,7 @@ async def delete_job(job_id: str):
 
     try:
         # Check if job exists
-        job_data = redis_client.get_job_status(job_id)
+        job_data = await run_in_threadpool(redis_client.get_job_status, job_id)
 
         if not job_data:
             raise HTTPException(
@@ -394,12 +547,11 @@ async def delete_job(job_id: str):
             )
 
         # Delete from Redis
-        redis_client.delete_job(job_id)
+        await run_in_threadpool(redis_client.delete_job, job_id)
 
         # Delete PDF file if it exists
-        file_path = Path(settings.upload_dir) / f"{job_id}.pdf"
-        if file_path.exists():
-            file_path.unlink()
+        file_path = settings.upload_path / f"{job_id}.pdf"
+        if await remove_file(file_path):
             logger.info(f"Deleted PDF file for job {job_id}")
 
         return {"message": f"Job {job_id} deleted successfully"}
@@ -449,7 +601,7 @@ async def global_exception_handler(request, exc):
     This ensures all errors are logged and returned in a consistent format.
     """
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
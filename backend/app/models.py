@@ -7,16 +7,30 @@ for API endpoints.
 """
 
 from enum import Enum
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
+def add_schema_example(schema: Dict[str, Any], model: type) -> None:
+    """
+    Attach a model's OpenAPI example to its JSON schema.
+
+    Used as json_schema_extra so the examples module is only imported
+    when a schema is actually generated, not when models are defined.
+    """
+    from .examples import EXAMPLES
+
+    example = EXAMPLES.get(model.__name__)
+    if example is not None:
+        schema["example"] = example
+
+
 class ParserType(str, Enum):
     """
     Supported PDF parser types.
 
-    - PYPDF: Fast text extraction using PyPDF library, with Gemini summary
+    - PYPDF: Fast native text extraction (PyMuPDF), with Gemini summary
     - GEMINI: AI-powered extraction with structured output and summary
     - MISTRAL: OCR-based extraction using Mistral AI for scanned documents
     """
@@ -40,29 +54,31 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
+# Value -> member lookups for data read back from Redis. A dict get skips
+# the enum metaclass __call__ path, which matters when listing many jobs.
+STATUS_BY_VALUE: Dict[str, JobStatus] = {member.value: member for member in JobStatus}
+PARSER_BY_VALUE: Dict[str, ParserType] = {member.value: member for member in ParserType}
+
+# Member -> value lookups for data written to Redis. Enum .value goes
+# through a descriptor on every access; these run on every enqueue.
+STATUS_VALUE: Dict[JobStatus, str] = {member: member.value for member in JobStatus}
+PARSER_VALUE: Dict[ParserType, str] = {member: member.value for member in ParserType}
+
+
 class UploadResponse(BaseModel):
     """
     Response model for file upload endpoint.
 
     Returned immediately after a file is uploaded and queued for processing.
     """
+    model_config = ConfigDict(frozen=True, json_schema_extra=add_schema_example)
+
     job_id: str = Field(..., description="Unique identifier for this processing job")
     status: JobStatus = Field(..., description="Current status (typically 'pending' on upload)")
     filename: str = Field(..., description="Original filename of the uploaded PDF")
     parser: ParserType = Field(..., description="Parser type selected for this job")
     timestamp: str = Field(..., description="ISO 8601 timestamp of job creation")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "job_id": "550e8400-e29b-41d4-a716-446655440000",
-                "status": "pending",
-                "filename": "contract.pdf",
-                "parser": "gemini",
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        }
-
 
 class JobStatusResponse(BaseModel):
     """
@@ -70,6 +86,8 @@ class JobStatusResponse(BaseModel):
 
     Provides current status and metadata for a specific job.
     """
+    model_config = ConfigDict(frozen=True, json_schema_extra=add_schema_example)
+
     job_id: str = Field(..., description="Unique identifier for this processing job")
     status: JobStatus = Field(..., description="Current processing status")
     filename: str = Field(..., description="Original filename of the uploaded PDF")
@@ -77,17 +95,18 @@ class JobStatusResponse(BaseModel):
     timestamp: str = Field(..., description="ISO 8601 timestamp of job creation")
     error: Optional[str] = Field(None, description="Error message if status is 'failed'")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "job_id": "550e8400-e29b-41d4-a716-446655440000",
-                "status": "processing",
-                "filename": "contract.pdf",
-                "parser": "gemini",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "error": None
-            }
-        }
+
+class Page(BaseModel):
+    """
+    Extracted content of a single PDF page.
+
+    Instances are immutable, and the page number is kept as a string to
+    match the API's existing JSON shape.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    page: str = Field(..., description="1-based page number")
+    content: str = Field(..., description="Extracted text of the page")
 
 
 class ProcessingResult(BaseModel):
@@ -97,11 +116,13 @@ class ProcessingResult(BaseModel):
     Contains extracted content organized by page, along with an AI-generated
     summary of the entire document. Only available when job status is 'completed'.
     """
+    model_config = ConfigDict(frozen=True, json_schema_extra=add_schema_example)
+
     job_id: str = Field(..., description="Unique identifier for this processing job")
     status: JobStatus = Field(..., description="Final processing status")
     filename: str = Field(..., description="Original filename of the uploaded PDF")
     parser: ParserType = Field(..., description="Parser type used for this job")
-    pages: List[Dict[str, str]] = Field(
+    pages: List[Page] = Field(
         ...,
         description="List of page objects with 'page' number and 'content' text"
     )
@@ -119,24 +140,6 @@ class ProcessingResult(BaseModel):
         description="Total time taken to process the document"
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "job_id": "550e8400-e29b-41d4-a716-446655440000",
-                "status": "completed",
-                "filename": "contract.pdf",
-                "parser": "gemini",
-                "pages": [
-                    {"page": "1", "content": "This is a sample contract..."},
-                    {"page": "2", "content": "Terms and conditions..."}
-                ],
-                "summary": "This document outlines a service agreement between two parties...",
-                "error": None,
-                "timestamp": "2024-01-15T10:30:00Z",
-                "processing_time_seconds": 12.5
-            }
-        }
-
 
 class JobListResponse(BaseModel):
     """
@@ -144,22 +147,7 @@ class JobListResponse(BaseModel):
 
     Provides a paginated list of all jobs in the system.
     """
+    model_config = ConfigDict(frozen=True, json_schema_extra=add_schema_example)
+
     jobs: List[JobStatusResponse] = Field(..., description="List of job status objects")
     total: int = Field(..., description="Total number of jobs in the system")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "jobs": [
-                    {
-                        "job_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "status": "completed",
-                        "filename": "contract.pdf",
-                        "parser": "gemini",
-                        "timestamp": "2024-01-15T10:30:00Z",
-                        "error": None
-                    }
-                ],
-                "total": 1
-            }
-        }
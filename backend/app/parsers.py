@@ -2,34 +2,121 @@
 PDF parsing implementations for different extraction methods.
 
 This module provides three parser implementations:
-1. PyPDF: Fast text extraction using PyPDF library + Gemini summary
+1. PyPDF: Fast native text extraction (via PyMuPDF) + Gemini summary
 2. Gemini: Full AI-powered extraction with structured output
 3. Mistral: OCR-based extraction for scanned documents
 
 Each parser returns a consistent structure: list of pages and a summary.
+Results are cached on disk by PDF content and parser configuration (see
+cache.py), so re-processing identical bytes skips the extraction.
 """
 
+import asyncio
 import logging
 import re
-import base64
+import hashlib
 import io
+import os
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 # PDF Processing
-from pypdf import PdfReader
-from pdf2image import convert_from_path
-from PIL import Image
+import aiofiles.os
+import fitz  # PyMuPDF
+import pybase64
 
 # AI APIs
+import httpx
 import google.generativeai as genai
+from google.api_core.exceptions import NotFound, PermissionDenied
 from mistralai import Mistral
 
-from .config import get_settings
+from .cache import ExtractionCache, hash_file, make_cache_key
+from .config import settings
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
+
+# MuPDF is not thread-safe, and the worker runs several jobs on threads at
+# once, so every PyMuPDF call goes through this lock. Work is serialized
+# per page, so documents still interleave and network I/O overlaps freely.
+MUPDF_LOCK = threading.RLock()
+
+# Model identifiers (also part of extraction cache keys)
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+MISTRAL_OCR_MODEL = "pixtral-12b-2409"  # Mistral's vision model
+MISTRAL_SUMMARY_MODEL = "mistral-small-latest"
+
+# Page rendering for Mistral OCR
+OCR_DPI = 150
+# Longest rendered edge in pixels (4 of Pixtral's 512px tiles); larger
+# pages are rendered at a lower DPI instead of being downsampled server-side
+OCR_MAX_EDGE_PX = 4 * 512
+OCR_JPEG_QUALITY = 85
+OCR_GRAY_JPEG_QUALITY = 80
+# Pages with at least this share of near-black/near-white samples are
+# sent as grayscale, which is smaller and OCRs just as well
+OCR_GRAYSCALE_RATIO = 0.95
+# Maps each 8-bit sample to 1 if it is near black or near white, else 0
+EXTREME_SAMPLE_TABLE = bytes(1 if v < 32 or v >= 224 else 0 for v in range(256))
+OCR_MAX_PAGES = 50
+# Pages with this much embedded text and at most this many images use their
+# native text instead of OCR (hybrid scanned/digital PDFs)
+NATIVE_TEXT_MIN_CHARS = 200
+NATIVE_TEXT_MAX_IMAGES = 1
+
+# PDF signature checks: the header must appear in the first PDF_HEAD_BYTES
+# and the end-of-file marker in the last PDF_TAIL_BYTES
+PDF_HEAD_BYTES = 1024
+PDF_TAIL_BYTES = 4096
+
+# HTTP settings for Mistral API clients (HTTP/2 multiplexes concurrent
+# requests over one kept-alive connection)
+MISTRAL_HTTP_TIMEOUT_SECONDS = 60.0
+MISTRAL_HTTP_RETRIES = 2
+MISTRAL_HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+# Gemini deletes uploaded files after 48h; reuse uploads for slightly less
+GEMINI_FILE_TTL_SECONDS = 47 * 3600
+
+# Errors the Files API returns for an expired or deleted upload (expired
+# files can surface as 403 rather than 404)
+GEMINI_FILE_GONE_ERRORS = (NotFound, PermissionDenied)
+
+# Bump whenever a prompt or extraction method changes so cached
+# extractions are not reused
+PROMPT_VERSION = "6"
+
+# Maximum document characters sent to the model for a summary
+SUMMARY_INPUT_CHARS = 50000
+
+# Markers in Gemini's structured extraction output
+SUMMARY_RE = re.compile(r'## Summary\s*\n(.*)', re.DOTALL | re.IGNORECASE)
+PAGE_MARKER = "---Page "  # followed by '<digits>---'
+
+# Standing instruction for document summaries, sent as the model's system
+# instruction rather than repeated inside every prompt
+SUMMARY_INSTRUCTION = """You are a professional document analyst.
+
+Please provide a concise, professional summary of the document you are given.
+Focus on the key points, main topics, and important details.
+Keep the summary to 3-5 sentences."""
+
+# Placeholder outputs for degraded results, which are never cached
+SUMMARY_FAILED = "Summary generation failed."
+OCR_FAILED_PREFIX = "[OCR failed for page"
+
+# Shared cache of parser outputs, keyed by PDF content and parser config
+extraction_cache = (
+    ExtractionCache(
+        settings.extraction_cache_dir,
+        max_bytes=settings.extraction_cache_max_mb * 1024 * 1024
+    )
+    if settings.extraction_cache_enabled
+    else None
+)
 
 
 # ========== Base Parser Interface ==========
@@ -39,11 +126,21 @@ class PDFParser:
     Base class for PDF parsers.
 
     All parsers should return the same structure for consistency.
+    Subclasses implement _parse(); parse() wraps it with the extraction
+    cache.
     """
 
+    # ParserType value handled by this parser
+    parser_type: str = ""
+
+    @property
+    def model_name(self) -> str:
+        """Identifier of the model(s) producing the output, for cache keys."""
+        return "none"
+
     def parse(self, pdf_path: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
         """
-        Parse PDF and extract content.
+        Parse PDF and extract content, reusing cached results when possible.
 
         Args:
             pdf_path: Path to the PDF file
@@ -56,36 +153,202 @@ class PDFParser:
         Raises:
             Exception: If parsing fails
         """
-        raise NotImplementedError("Subclasses must implement parse method")
+        if extraction_cache is None:
+            return self._parse(pdf_path)
+
+        cache_key, content_digest = self._cache_key(pdf_path)
+        cached = extraction_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Extraction cache hit for {pdf_path} ({self.parser_type})")
+            return cached
+
+        pages, summary = self._parse(pdf_path, content_digest=content_digest)
+
+        if self._is_cacheable(pages, summary):
+            extraction_cache.put(
+                cache_key, pages, summary, self.model_name, PROMPT_VERSION
+            )
+
+        return pages, summary
+
+    async def parse_async(self, pdf_path: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Async variant of parse() that never blocks the event loop.
+
+        File hashing and cache I/O run in worker threads, and the
+        extraction itself runs through _parse_async().
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Tuple of (pages, summary)
+
+        Raises:
+            Exception: If parsing fails
+        """
+        if extraction_cache is None:
+            return await self._parse_async(pdf_path)
+
+        cache_key, content_digest = await asyncio.to_thread(self._cache_key, pdf_path)
+        cached = await asyncio.to_thread(extraction_cache.get, cache_key)
+        if cached is not None:
+            logger.info(f"Extraction cache hit for {pdf_path} ({self.parser_type})")
+            return cached
+
+        pages, summary = await self._parse_async(pdf_path, content_digest=content_digest)
+
+        if self._is_cacheable(pages, summary):
+            await asyncio.to_thread(
+                extraction_cache.put,
+                cache_key, pages, summary, self.model_name, PROMPT_VERSION
+            )
+
+        return pages, summary
+
+    def _cache_key(self, pdf_path: str) -> Tuple[str, str]:
+        """
+        Hash the PDF once for both the cache key and the content digest.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Tuple of (extraction cache key, SHA-256 hex digest of the PDF)
+        """
+        content_hash = hash_file(pdf_path)
+        cache_key = make_cache_key(
+            content_hash, self.parser_type, self.model_name, PROMPT_VERSION
+        )
+        return cache_key, content_hash.hexdigest()
+
+    async def _parse_async(
+        self,
+        pdf_path: str,
+        content_digest: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Run the extraction without blocking the event loop.
+
+        Defaults to running _parse() in a worker thread; parsers with a
+        native async pipeline override this.
+
+        Args:
+            pdf_path: Path to the PDF file
+            content_digest: SHA-256 hex digest of the PDF, if already known
+
+        Returns:
+            Tuple of (pages, summary)
+        """
+        return await asyncio.to_thread(
+            self._parse, pdf_path, content_digest=content_digest
+        )
+
+    def _parse(
+        self,
+        pdf_path: str,
+        content_digest: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Run the actual extraction, bypassing the cache.
+
+        Args:
+            pdf_path: Path to the PDF file
+            content_digest: SHA-256 hex digest of the PDF, if already known
+                (computed by parse() for the cache key)
+
+        Returns:
+            Tuple of (pages, summary)
+
+        Raises:
+            Exception: If parsing fails
+        """
+        raise NotImplementedError("Subclasses must implement _parse method")
+
+    def _is_cacheable(
+        self,
+        pages: List[Dict[str, str]],
+        summary: Optional[str]
+    ) -> bool:
+        """
+        Check whether a result is complete enough to cache.
+
+        Degraded results (e.g. a failed summary) are not cached so that
+        re-processing gets a chance to produce the full output.
+        """
+        return summary != SUMMARY_FAILED
 
 
 # ========== PyPDF Parser ==========
 
+def _extract_pages(pdf_path: str) -> List[Tuple[str, str]]:
+    """
+    Extract raw native text for every page.
+
+    MUPDF_LOCK is taken per page rather than for the whole document, so
+    other job threads can use PyMuPDF between pages.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        List of (page number, raw page text) pairs, in page order
+    """
+    with MUPDF_LOCK:
+        doc = fitz.open(pdf_path)
+    try:
+        pages = []
+        for index in range(doc.page_count):
+            with MUPDF_LOCK:
+                text = doc.load_page(index).get_text("text")
+            pages.append((str(index + 1), text))
+        return pages
+    finally:
+        with MUPDF_LOCK:
+            doc.close()
+
+
 class PyPDFParser(PDFParser):
     """
-    Fast text extraction using PyPDF library.
+    Fast native text extraction for text-based PDFs.
 
     This parser:
-    1. Extracts text page-by-page using PyPDF
+    1. Extracts text page-by-page using PyMuPDF (MuPDF's C extractor)
     2. Uses Gemini to generate a summary of the full document
+
+    The name is kept for the 'pypdf' parser type exposed by the API.
     """
 
+    parser_type = "pypdf"
+
     def __init__(self):
         """Initialize PyPDF parser with Gemini for summaries."""
         if settings.google_api_key:
             genai.configure(api_key=settings.google_api_key)
-            self.gemini_model = genai.GenerativeModel("gemini-2.0-flash-exp")
+            self.gemini_model = genai.GenerativeModel(
+                GEMINI_MODEL, system_instruction=SUMMARY_INSTRUCTION
+            )
             logger.info("PyPDF parser initialized with Gemini 2.0 for summaries")
         else:
             self.gemini_model = None
             logger.warning("PyPDF parser initialized without Gemini (no API key)")
 
-    def parse(self, pdf_path: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    @property
+    def model_name(self) -> str:
+        """Summary model, or 'none' when summaries are disabled."""
+        return GEMINI_MODEL if self.gemini_model else "none"
+
+    def _parse(
+        self,
+        pdf_path: str,
+        content_digest: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
         """
-        Extract text using PyPDF and generate summary with Gemini.
+        Extract text using PyMuPDF and generate summary with Gemini.
 
         Args:
             pdf_path: Path to the PDF file
+            content_digest: SHA-256 hex digest of the PDF, if already known
 
         Returns:
             Tuple of (pages, summary)
@@ -97,39 +360,42 @@ class PyPDFParser(PDFParser):
             logger.info(f"Starting PyPDF extraction for {pdf_path}")
             start_time = time.time()
 
-            # Extract text page by page
-            reader = PdfReader(pdf_path)
+            # Extract text page by page, keeping only the prefix that fits
+            # in the summary prompt
+            native_pages = _extract_pages(pdf_path)
+
             pages = []
-            full_text = []
+            summary_input = io.StringIO()
 
-            for page_num, page in enumerate(reader.pages, start=1):
-                text = page.extract_text()
+            for page_num, text in native_pages:
                 pages.append({
-                    "page": str(page_num),
+                    "page": page_num,
                     "content": text.strip()
                 })
-                full_text.append(text)
+                if summary_input.tell() < SUMMARY_INPUT_CHARS:
+                    if page_num != "1":
+                        summary_input.write("\n\n")
+                    summary_input.write(text)
 
             # Generate summary using Gemini
             summary = None
             if self.gemini_model:
                 try:
-                    combined_text = "\n\n".join(full_text)
-                    prompt = f"""You are a professional document analyst.
-
-Please provide a concise, professional summary of the following document.
-Focus on the key points, main topics, and important details.
-Keep the summary to 3-5 sentences.
-
-Document content:
-{combined_text[:50000]}  # Limit to avoid token limits
+                    combined_text = summary_input.getvalue()[:SUMMARY_INPUT_CHARS]
+                    prompt = f"""Document content:
+{combined_text}
 """
-                    response = self.gemini_model.generate_content(prompt)
-                    summary = response.text.strip()
+                    # Stream the response and assemble it as chunks arrive.
+                    # Chunks without parts (e.g. a trailing finish or safety
+                    # chunk) raise on .text, so they are skipped.
+                    response = self.gemini_model.generate_content(prompt, stream=True)
+                    summary = "".join(
+                        chunk.text for chunk in response if chunk.parts
+                    ).strip()
                     logger.info(f"Generated summary using Gemini")
                 except Exception as e:
                     logger.error(f"Failed to generate summary with Gemini: {e}")
-                    summary = "Summary generation failed."
+                    summary = SUMMARY_FAILED
 
             elapsed = time.time() - start_time
             logger.info(
@@ -151,26 +417,40 @@ class GeminiParser(PDFParser):
     AI-powered PDF extraction using Google Gemini.
 
     This parser:
-    1. Uploads the entire PDF to Gemini
+    1. Uploads the entire PDF to Gemini (reusing earlier uploads)
     2. Uses a structured prompt to extract content with page boundaries
     3. Parses the response to separate pages and summary
     """
 
+    parser_type = "gemini"
+    model_name = GEMINI_MODEL
+
+    # PDF SHA-256 -> (uploaded file, monotonic upload time). Class-level so
+    # uploads are shared by every parser instance in the process.
+    _upload_cache: Dict[str, Tuple[Any, float]] = {}
+    # Guards _upload_cache; network calls happen outside the lock
+    _upload_lock = threading.Lock()
+
     def __init__(self):
         """Initialize Gemini parser."""
         if not settings.google_api_key:
             raise ValueError("Google API key required for Gemini parser")
 
         genai.configure(api_key=settings.google_api_key)
-        self.model = genai.GenerativeModel("gemini-2.0-flash-exp")
+        self.model = genai.GenerativeModel(GEMINI_MODEL)
         logger.info("Gemini 2.0 parser initialized")
 
-    def parse(self, pdf_path: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    def _parse(
+        self,
+        pdf_path: str,
+        content_digest: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
         """
         Extract text using Gemini AI with structured output.
 
         Args:
             pdf_path: Path to the PDF file
+            content_digest: SHA-256 hex digest of the PDF, if already known
 
         Returns:
             Tuple of (pages, summary)
@@ -182,9 +462,10 @@ class GeminiParser(PDFParser):
             logger.info(f"Starting Gemini extraction for {pdf_path}")
             start_time = time.time()
 
-            # Upload PDF to Gemini
-            pdf_file = genai.upload_file(pdf_path)
-            logger.debug(f"Uploaded PDF to Gemini: {pdf_file.uri}")
+            # Upload PDF to Gemini, or reuse a live upload of the same bytes;
+            # parse() already hashed the file for the cache key
+            digest = content_digest or hash_file(pdf_path).hexdigest()
+            pdf_file = self._get_uploaded_file(pdf_path, digest)
 
             # Structured prompt for page-by-page extraction
             prompt = """You are a PDF processing expert.
@@ -208,7 +489,15 @@ Your concise summary here (3-5 sentences).
 Begin extraction now:"""
 
             # Generate content
-            response = self.model.generate_content([pdf_file, prompt])
+            try:
+                response = self.model.generate_content([pdf_file, prompt])
+            except GEMINI_FILE_GONE_ERRORS:
+                # The upload expired between the lookup and the request
+                logger.info(f"Gemini file {pdf_file.name} expired, re-uploading")
+                with self._upload_lock:
+                    self._upload_cache.pop(digest, None)
+                pdf_file = self._get_uploaded_file(pdf_path, digest)
+                response = self.model.generate_content([pdf_file, prompt])
             content = response.text
 
             # Parse response to extract pages and summary
@@ -226,6 +515,47 @@ Begin extraction now:"""
             logger.error(f"Gemini parsing failed for {pdf_path}: {e}")
             raise
 
+    def _get_uploaded_file(self, pdf_path: str, digest: str) -> Any:
+        """
+        Get a Gemini file handle for the PDF, uploading only when needed.
+
+        A cached upload is reused while it is younger than
+        GEMINI_FILE_TTL_SECONDS and Gemini still knows about it.
+
+        Args:
+            pdf_path: Path to the PDF file
+            digest: SHA-256 hex digest of the PDF content
+
+        Returns:
+            Uploaded Gemini file handle
+        """
+        now = time.monotonic()
+        with self._upload_lock:
+            entry = self._upload_cache.get(digest)
+        if entry is not None:
+            pdf_file, uploaded_at = entry
+            if now - uploaded_at < GEMINI_FILE_TTL_SECONDS:
+                try:
+                    genai.get_file(pdf_file.name)
+                    logger.debug(f"Reusing Gemini upload: {pdf_file.uri}")
+                    return pdf_file
+                except GEMINI_FILE_GONE_ERRORS:
+                    logger.info(f"Gemini file {pdf_file.name} no longer exists")
+            with self._upload_lock:
+                self._upload_cache.pop(digest, None)
+
+        pdf_file = genai.upload_file(pdf_path)
+        logger.debug(f"Uploaded PDF to Gemini: {pdf_file.uri}")
+
+        with self._upload_lock:
+            # Drop expired uploads so the cache cannot grow without bound
+            for key, (_, uploaded_at) in list(self._upload_cache.items()):
+                if now - uploaded_at >= GEMINI_FILE_TTL_SECONDS:
+                    del self._upload_cache[key]
+            self._upload_cache[digest] = (pdf_file, now)
+
+        return pdf_file
+
     def _parse_gemini_response(
         self,
         content: str
@@ -243,19 +573,14 @@ Begin extraction now:"""
         summary = None
 
         # Extract summary first (everything after ## Summary)
-        summary_match = re.search(r'## Summary\s*\n(.*)', content, re.DOTALL | re.IGNORECASE)
+        summary_match = SUMMARY_RE.search(content)
         if summary_match:
             summary = summary_match.group(1).strip()
             # Remove summary from content for page parsing
             content = content[:summary_match.start()]
 
         # Extract pages (split by ---Page X--- markers)
-        page_pattern = r'---Page (\d+)---\s*\n(.*?)(?=---Page \d+---|$)'
-        page_matches = re.finditer(page_pattern, content, re.DOTALL)
-
-        for match in page_matches:
-            page_num = match.group(1)
-            page_content = match.group(2).strip()
+        for page_num, page_content in self._split_pages(content):
             pages.append({
                 "page": page_num,
                 "content": page_content
@@ -272,6 +597,45 @@ Begin extraction now:"""
         logger.debug(f"Parsed {len(pages)} pages and summary from Gemini response")
         return pages, summary
 
+    def _split_pages(self, content: str) -> List[Tuple[str, str]]:
+        """
+        Split content on '---Page X---' markers in a single forward scan.
+
+        Uses str.find instead of the regex engine. A page runs from its
+        marker to the next valid marker (or the end of the content), and a
+        marker must be followed by a line break to start a page.
+
+        Args:
+            content: Gemini response with the summary already removed
+
+        Returns:
+            List of (page number, stripped page content) tuples
+        """
+        # (marker start, page number, marker end) for each valid marker
+        markers = []
+        pos = content.find(PAGE_MARKER)
+        while pos >= 0:
+            num_start = pos + len(PAGE_MARKER)
+            num_end = content.find("---", num_start)
+            page_num = content[num_start:num_end]
+            if num_end > num_start and page_num.isdecimal():
+                markers.append((pos, page_num, num_end + 3))
+                # The closing '---' may itself begin the next marker
+                pos = content.find(PAGE_MARKER, num_end)
+            else:
+                pos = content.find(PAGE_MARKER, pos + 1)
+
+        pages = []
+        for index, (_, page_num, body_start) in enumerate(markers):
+            body_end = markers[index + 1][0] if index + 1 < len(markers) else len(content)
+            body = content[body_start:body_end]
+            stripped = body.lstrip()
+            if "\n" not in body[:len(body) - len(stripped)]:
+                continue
+            pages.append((page_num, stripped.rstrip()))
+
+        return pages
+
 
 # ========== Mistral Parser (OCR) ==========
 
@@ -284,28 +648,72 @@ class MistralParser(PDFParser):
     are used to perform OCR on each page.
     """
 
+    parser_type = "mistral"
+    model_name = f"{MISTRAL_OCR_MODEL}+{MISTRAL_SUMMARY_MODEL}"
+
     def __init__(self):
         """Initialize Mistral parser."""
         if not settings.mistral_api_key:
             raise ValueError("Mistral API key required for Mistral parser")
 
-        self.client = Mistral(api_key=settings.mistral_api_key)
-        self.model = "pixtral-12b-2409"  # Mistral's vision model
+        # Persistent HTTP/2 client for synchronous calls (summaries)
+        self.http_client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True, retries=MISTRAL_HTTP_RETRIES, limits=MISTRAL_HTTP_LIMITS
+            ),
+            timeout=MISTRAL_HTTP_TIMEOUT_SECONDS
+        )
+        self.client = Mistral(api_key=settings.mistral_api_key, client=self.http_client)
+        self.model = MISTRAL_OCR_MODEL
         logger.info("Mistral OCR parser initialized")
 
-    def parse(self, pdf_path: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    def _is_cacheable(
+        self,
+        pages: List[Dict[str, str]],
+        summary: Optional[str]
+    ) -> bool:
+        """Also skip caching when OCR failed for any page."""
+        return super()._is_cacheable(pages, summary) and not any(
+            page["content"].startswith(OCR_FAILED_PREFIX) for page in pages
+        )
+
+    def _parse(
+        self,
+        pdf_path: str,
+        content_digest: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Run the async OCR pipeline to completion on a new event loop.
+
+        Args:
+            pdf_path: Path to the PDF file
+            content_digest: SHA-256 hex digest of the PDF, if already known
+
+        Returns:
+            Tuple of (pages, summary)
+        """
+        return asyncio.run(self._parse_async(pdf_path))
+
+    async def _parse_async(
+        self,
+        pdf_path: str,
+        content_digest: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
         """
         Extract text using Mistral OCR.
 
         This implementation:
-        1. Converts PDF pages to images
+        1. Renders PDF pages to JPEG images with PyMuPDF, except pages that
+           already carry enough embedded text, which is used as-is
         2. Encodes images as base64
-        3. Sends each image to Mistral's vision API for OCR
+        3. Sends the images to Mistral's vision API for OCR, concurrently
+           and while later pages are still rendering
         4. Collects text from all pages
         5. Generates a summary using Mistral
 
         Args:
             pdf_path: Path to the PDF file
+            content_digest: SHA-256 hex digest of the PDF, if already known
 
         Returns:
             Tuple of (pages, summary)
@@ -318,7 +726,7 @@ class MistralParser(PDFParser):
             start_time = time.time()
 
             # Check file size to prevent memory issues
-            file_size_mb = Path(pdf_path).stat().st_size / (1024 * 1024)
+            file_size_mb = (await aiofiles.os.stat(pdf_path)).st_size / (1024 * 1024)
             if file_size_mb > 50:
                 raise RuntimeError(
                     f"PDF file too large for OCR ({file_size_mb:.1f}MB). "
@@ -326,51 +734,35 @@ class MistralParser(PDFParser):
                     f"Please use PyPDF or Gemini parser instead."
                 )
 
-            # Convert PDF pages to images
+            # Open the PDF for rendering
             logger.info(f"Converting PDF to images (file size: {file_size_mb:.1f}MB)...")
             try:
-                # Use lower DPI and limit first_page/last_page to prevent crashes
-                images = convert_from_path(
-                    pdf_path,
-                    dpi=150,  # Reduced from 200 to prevent memory issues
-                    fmt='jpeg',
-                    jpegopt={'quality': 85, 'progressive': True, 'optimize': True}
-                )
-                logger.info(f"Converted PDF to {len(images)} image(s)")
-
-                # Limit number of pages to prevent excessive processing
-                if len(images) > 50:
-                    logger.warning(f"PDF has {len(images)} pages, limiting to first 50 for OCR")
-                    images = images[:50]
-
+                doc = await asyncio.to_thread(self._open_pdf, pdf_path)
             except Exception as conv_error:
                 logger.error(f"PDF to image conversion failed: {conv_error}", exc_info=True)
                 raise RuntimeError(f"Failed to convert PDF to images: {str(conv_error)}")
 
-            # Process each page with OCR
-            pages = []
-            full_text = []
-
-            for page_num, image in enumerate(images, start=1):
-                logger.info(f"Processing page {page_num}/{len(images)} with OCR...")
-
-                # Convert PIL Image to base64
-                image_base64 = self._image_to_base64(image)
-
-                # Extract text using Mistral vision API
-                text = self._extract_text_from_image(image_base64, page_num)
-
-                pages.append({
-                    "page": str(page_num),
-                    "content": text
-                })
-                full_text.append(text)
-
-                logger.info(f"Page {page_num} OCR completed ({len(text)} characters)")
+            try:
+                page_count = doc.page_count
+                if page_count > OCR_MAX_PAGES:
+                    logger.warning(
+                        f"PDF has {page_count} pages, limiting to first {OCR_MAX_PAGES} for OCR"
+                    )
+                    page_count = OCR_MAX_PAGES
+
+                # Render and OCR all pages concurrently (results in page order)
+                full_text = await self._ocr_pages(doc, page_count)
+            finally:
+                with MUPDF_LOCK:
+                    doc.close()
+            pages = [
+                {"page": str(page_num), "content": text}
+                for page_num, text in enumerate(full_text, start=1)
+            ]
 
             # Generate summary using Mistral
             logger.info("Generating summary with Mistral...")
-            summary = self._generate_summary(full_text)
+            summary = await asyncio.to_thread(self._generate_summary, full_text)
 
             elapsed = time.time() - start_time
             logger.info(
@@ -384,37 +776,199 @@ class MistralParser(PDFParser):
             logger.error(f"Mistral OCR parsing failed for {pdf_path}: {e}")
             raise
 
-    def _image_to_base64(self, image: Image.Image) -> str:
+    def _open_pdf(self, pdf_path: str) -> fitz.Document:
+        """Open a PDF for rendering while holding MUPDF_LOCK."""
+        with MUPDF_LOCK:
+            return fitz.open(pdf_path)
+
+    def _prepare_page(
+        self,
+        doc: fitz.Document,
+        index: int
+    ) -> Tuple[Optional[str], Optional[Tuple[str, str]]]:
+        """
+        Get a page's native text if it is text-dominant, else render it.
+
+        A page with at least NATIVE_TEXT_MIN_CHARS characters of embedded
+        text and no more than NATIVE_TEXT_MAX_IMAGES images is digital
+        rather than scanned, so its text is used without an OCR call.
+        Rendered pages are also encoded here, off the event loop.
+
+        Args:
+            doc: Open PDF document
+            index: Zero-based page index
+
+        Returns:
+            Tuple of (native text, None) or (None, (base64-encoded JPEG,
+            SHA-256 hex digest of the JPEG))
+        """
+        with MUPDF_LOCK:
+            page = doc.load_page(index)
+            native_text = page.get_text("text").strip()
+            if (
+                len(native_text) >= NATIVE_TEXT_MIN_CHARS
+                and len(page.get_images()) <= NATIVE_TEXT_MAX_IMAGES
+            ):
+                return native_text, None
+
+            jpeg = self._render_page(page)
+
+        return None, self._jpeg_to_base64(jpeg)
+
+    def _render_page(self, page: fitz.Page) -> bytes:
+        """
+        Render one PDF page to JPEG in-process with MuPDF.
+
+        Pages are rendered at OCR_DPI, or lower when that would make the
+        longest edge exceed OCR_MAX_EDGE_PX. Pixmaps are rendered without
+        alpha, so they are already RGB and can be encoded to JPEG directly.
+        Text-on-white pages, where nearly all samples are close to black or
+        white, are converted to grayscale first to shrink the upload.
+
+        Args:
+            page: PDF page
+
+        Returns:
+            JPEG bytes of the rendered page
+        """
+        zoom = OCR_DPI / 72
+        longest_edge = max(page.rect.width, page.rect.height) * zoom
+        if longest_edge > OCR_MAX_EDGE_PX:
+            zoom *= OCR_MAX_EDGE_PX / longest_edge
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+        # Count extreme samples in C: translate() maps them to 1, count() sums
+        samples = pix.samples
+        extreme = samples.translate(EXTREME_SAMPLE_TABLE).count(1)
+        if samples and extreme >= OCR_GRAYSCALE_RATIO * len(samples):
+            return fitz.Pixmap(fitz.csGRAY, pix).tobytes(
+                "jpeg", jpg_quality=OCR_GRAY_JPEG_QUALITY
+            )
+
+        return pix.tobytes("jpeg", jpg_quality=OCR_JPEG_QUALITY)
+
+    def _jpeg_to_base64(self, jpeg: bytes) -> Tuple[str, str]:
+        """
+        Encode a rendered JPEG page as base64.
+
+        Args:
+            jpeg: JPEG image bytes
+
+        Returns:
+            Tuple of (base64-encoded JPEG, SHA-256 hex digest of the JPEG)
+        """
+        return pybase64.b64encode_as_string(jpeg), hashlib.sha256(jpeg).hexdigest()
+
+    async def _ocr_pages(self, doc: fitz.Document, page_count: int) -> List[str]:
         """
-        Convert PIL Image to base64 string.
+        Render and OCR the first page_count pages concurrently.
+
+        Pages are prepared (rendered, hashed and base64-encoded) in order on
+        a background thread, and each page's OCR request starts as soon as
+        it is ready, so that CPU work overlaps with network I/O and never
+        blocks the event loop. Text-dominant pages skip OCR entirely.
+        MuPDF is not thread-safe, so a single render thread owns the
+        document.
+
+        At most settings.ocr_concurrency requests are in flight at once to
+        stay within API rate limits. Pages whose rendered JPEG is identical
+        to an earlier page (blank separators, repeated covers) reuse that
+        page's OCR request instead of making their own. A fresh async HTTP
+        client is used per call because each call may run on a different
+        event loop (asyncio.run() in _parse, or the caller's loop).
 
         Args:
-            image: PIL Image object
+            doc: Open PDF document
+            page_count: Number of leading pages to process
 
         Returns:
-            Base64-encoded image string
+            Extracted text for each page, in page order
         """
-        # Convert to RGB if necessary (remove alpha channel)
-        if image.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode in ('RGBA', 'LA') else None)
-            image = background
+        semaphore = asyncio.Semaphore(max(1, settings.ocr_concurrency))
+        # JPEG digest -> OCR task of the first page with that content
+        seen: Dict[str, asyncio.Task] = {}
+        native_pages = 0
+        render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+        renders: List[Future] = []
+
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True, retries=MISTRAL_HTTP_RETRIES, limits=MISTRAL_HTTP_LIMITS
+                ),
+                timeout=MISTRAL_HTTP_TIMEOUT_SECONDS
+            ) as http_client:
+                # Pass the persistent sync client too; otherwise the SDK
+                # builds a fresh httpx.Client for every document
+                client = Mistral(
+                    api_key=settings.mistral_api_key,
+                    client=self.http_client,
+                    async_client=http_client
+                )
 
-        # Save to bytes buffer
-        buffer = io.BytesIO()
-        image.save(buffer, format='JPEG', quality=85)
-        buffer.seek(0)
+                async def ocr_page(page_num: int, image_base64: str) -> str:
+                    async with semaphore:
+                        logger.info(f"Processing page {page_num}/{page_count} with OCR...")
+                        text = await self._extract_text_from_image_async(
+                            client, image_base64, page_num
+                        )
+                        logger.info(f"Page {page_num} OCR completed ({len(text)} characters)")
+                        return text
+
+                async def process_page(page_num: int) -> str:
+                    nonlocal native_pages
+                    render = render_pool.submit(self._prepare_page, doc, page_num - 1)
+                    renders.append(render)
+                    try:
+                        native_text, encoded = await asyncio.wrap_future(render)
+                    except Exception as render_error:
+                        raise RuntimeError(
+                            f"Failed to convert page {page_num} to image: {render_error}"
+                        ) from render_error
+
+                    if native_text is not None:
+                        native_pages += 1
+                        return native_text
+
+                    image_base64, digest = encoded
+                    task = seen.get(digest)
+                    if task is None:
+                        task = seen[digest] = asyncio.ensure_future(
+                            ocr_page(page_num, image_base64)
+                        )
+                    return await task
+
+                results = await asyncio.gather(
+                    *(process_page(page_num) for page_num in range(1, page_count + 1))
+                )
+        finally:
+            # Drop renders still queued after a failure, then wait (off the
+            # event loop) for one still running: the caller closes the
+            # document as soon as this returns
+            render_pool.shutdown(wait=False, cancel_futures=True)
+            if renders:
+                await asyncio.to_thread(wait, renders)
+
+        if native_pages:
+            logger.info(f"Used embedded text for {native_pages} page(s), skipping OCR")
 
-        # Encode as base64
-        return base64.b64encode(buffer.read()).decode('utf-8')
+        duplicates = page_count - native_pages - len(seen)
+        if duplicates:
+            logger.info(f"Reusing OCR text for {duplicates} duplicate page(s)")
 
-    def _extract_text_from_image(self, image_base64: str, page_num: int) -> str:
+        return results
+
+    async def _extract_text_from_image_async(
+        self,
+        client: Mistral,
+        image_base64: str,
+        page_num: int
+    ) -> str:
         """
         Extract text from image using Mistral vision API.
 
         Args:
+            client: Mistral client bound to the current event loop
             image_base64: Base64-encoded image
             page_num: Page number for context
 
@@ -448,7 +1002,7 @@ Output only the extracted text, no additional commentary."""
             ]
 
             # Call Mistral vision API
-            response = self.client.chat.complete(
+            response = await client.chat.complete_async(
                 model=self.model,
                 messages=messages
             )
@@ -459,7 +1013,7 @@ Output only the extracted text, no additional commentary."""
 
         except Exception as e:
             logger.error(f"Failed to extract text from page {page_num}: {e}")
-            return f"[OCR failed for page {page_num}: {str(e)}]"
+            return f"{OCR_FAILED_PREFIX} {page_num}: {str(e)}]"
 
     def _generate_summary(self, full_text: List[str]) -> str:
         """
@@ -472,13 +1026,11 @@ Output only the extracted text, no additional commentary."""
             AI-generated summary
         """
         try:
-            combined_text = "\n\n".join(full_text)
-
             # Limit text length to avoid token limits
-            max_chars = 50000
-            if len(combined_text) > max_chars:
-                combined_text = combined_text[:max_chars] + "..."
-                logger.info(f"Truncated text to {max_chars} characters for summary")
+            combined_text, truncated = join_capped(full_text, SUMMARY_INPUT_CHARS)
+            if truncated:
+                combined_text += "..."
+                logger.info(f"Truncated text to {SUMMARY_INPUT_CHARS} characters for summary")
 
             # Create summary prompt
             messages = [
@@ -497,7 +1049,7 @@ Document content:
 
             # Call Mistral chat API for summary
             response = self.client.chat.complete(
-                model="mistral-small-latest",  # Use text model for summary
+                model=MISTRAL_SUMMARY_MODEL,  # Use text model for summary
                 messages=messages
             )
 
@@ -507,15 +1059,25 @@ Document content:
 
         except Exception as e:
             logger.error(f"Failed to generate summary with Mistral: {e}")
-            return "Summary generation failed."
+            return SUMMARY_FAILED
 
 
 # ========== Parser Factory ==========
 
+# Parser instances by normalized type; reads take no lock, and only
+# first-time construction is serialized so each type is built once
+_parsers: Dict[str, PDFParser] = {}
+_parser_lock = threading.Lock()
+
+
 def get_parser(parser_type: str) -> PDFParser:
     """
     Factory function to get the appropriate parser instance.
 
+    Parsers are built once per type and shared for the life of the
+    process, so SDK clients, HTTP connection pools and model handles are
+    reused across jobs. Parser instances must therefore be thread-safe.
+
     Args:
         parser_type: Parser type ('pypdf', 'gemini', or 'mistral')
 
@@ -525,8 +1087,32 @@ def get_parser(parser_type: str) -> PDFParser:
     Raises:
         ValueError: If parser type is invalid or API key is missing
     """
-    parser_type = parser_type.lower()
+    key = parser_type.lower()
+    parser = _parsers.get(key)
+    if parser is None:
+        with _parser_lock:
+            parser = _parsers.get(key)
+            if parser is None:
+                parser = _parsers[key] = _build_parser(key)
+    return parser
+
+
+def _build_parser(parser_type: str) -> PDFParser:
+    """
+    Build the parser for a normalized parser type.
+
+    Construction errors are not cached, so a missing API key is reported
+    on every call rather than remembered.
+
+    Args:
+        parser_type: Lower-cased parser type
+
+    Returns:
+        New parser instance
 
+    Raises:
+        ValueError: If parser type is invalid or API key is missing
+    """
     if parser_type == "pypdf":
         return PyPDFParser()
     elif parser_type == "gemini":
@@ -542,28 +1128,77 @@ def get_parser(parser_type: str) -> PDFParser:
 
 # ========== Utility Functions ==========
 
-def validate_pdf(pdf_path: str) -> bool:
+def join_capped(
+    parts: List[str],
+    max_chars: int,
+    separator: str = "\n\n"
+) -> Tuple[str, bool]:
+    """
+    Join strings, stopping once max_chars characters have been produced.
+
+    Gives the same text as separator.join(parts)[:max_chars] without
+    building the full joined string first.
+
+    Args:
+        parts: Strings to join
+        max_chars: Maximum length of the result
+        separator: Separator placed between parts
+
+    Returns:
+        Tuple of (joined text, whether anything was cut off)
+    """
+    chunks = []
+    remaining = max_chars
+
+    for index, part in enumerate(parts):
+        for piece in ((separator, part) if index else (part,)):
+            if len(piece) > remaining:
+                chunks.append(piece[:remaining])
+                return "".join(chunks), True
+            chunks.append(piece)
+            remaining -= len(piece)
+
+    return "".join(chunks), False
+
+
+def validate_pdf(pdf_path: str) -> None:
     """
     Validate that the file exists and is a PDF.
 
+    Besides the suffix, the file must carry the '%PDF-' header near the
+    start and a '%%EOF' trailer near the end. Only those two small regions
+    are read, so truncated or mislabeled uploads are rejected before a
+    parser opens them.
+
     Args:
         pdf_path: Path to the PDF file
 
-    Returns:
-        True if valid, False otherwise
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file exists but is not a valid PDF
     """
     path = Path(pdf_path)
 
     if not path.exists():
-        logger.error(f"PDF file not found: {pdf_path}")
-        return False
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
     if not path.is_file():
-        logger.error(f"Path is not a file: {pdf_path}")
-        return False
+        raise ValueError(f"Not a valid PDF: path is not a file: {pdf_path}")
 
     if path.suffix.lower() != '.pdf':
-        logger.error(f"File is not a PDF: {pdf_path}")
-        return False
-
-    return True
+        raise ValueError(f"Not a valid PDF: wrong file suffix: {pdf_path}")
+
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(PDF_HEAD_BYTES)
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(size - PDF_TAIL_BYTES, 0))
+            tail = f.read()
+    except OSError as e:
+        raise ValueError(f"Not a valid PDF: could not read {pdf_path}: {e}") from e
+
+    if b'%PDF-' not in head:
+        raise ValueError(f"Not a valid PDF: no PDF header: {pdf_path}")
+
+    if b'%%EOF' not in tail:
+        raise ValueError(f"Not a valid PDF: no PDF trailer (truncated?): {pdf_path}")
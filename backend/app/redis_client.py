@@ -1,25 +1,117 @@
 """
 Redis client and data structure operations.
 
-This module provides a clean interface to Redis, implementing the three
+This module provides a clean interface to Redis, implementing the
 core data structures used in the application:
 - Stream: Job queue (pdf-jobs)
 - Hash: Job metadata and status (job:{job_id})
-- String: Processing results (result:{job_id})
+- String: Processing results (result:{job_id}), zstd-compressed when large
+- String: Upload content digests (digest:{parser}:{sha256})
+- Set: Index of all job IDs (jobs:index)
 """
 
-import json
 import logging
-from typing import Optional, Dict, List, Any
-from datetime import datetime
+import os
+import socket
+import threading
+from typing import Optional, Dict, List, Any, Tuple, Union
 import redis
+import zstandard
+from pydantic import TypeAdapter
+from redis.client import NEVER_DECODE
 from redis.exceptions import RedisError, ResponseError
 
-from .models import JobStatus, ParserType, ProcessingResult
-from .config import get_settings
+from .models import JobStatus, ParserType, ProcessingResult, PARSER_VALUE, STATUS_VALUE
+from .config import settings
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
+
+# Set of every job ID, so listing jobs never scans the whole keyspace
+JOB_INDEX_KEY = "jobs:index"
+
+# Set once the job index has been backfilled from existing job hashes
+JOB_INDEX_BUILT_KEY = "jobs:index:built"
+
+# Number of job IDs fetched per SSCAN/SCAN call and per HGETALL pipeline
+JOB_SCAN_BATCH_SIZE = 500
+
+# Serializes results straight to UTF-8 JSON bytes, which redis-py sends
+# as-is (model_dump_json() would decode to str only for redis to re-encode)
+RESULT_ADAPTER = TypeAdapter(ProcessingResult)
+
+# Results at least this large (in JSON bytes) are stored zstd-compressed
+RESULT_COMPRESSION_MIN_BYTES = 1024
+RESULT_COMPRESSION_LEVEL = 3
+
+# Every zstd frame starts with this magic number, while stored JSON starts
+# with '{', so compressed and plain results are told apart on read
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# zstd contexts must not be shared between threads
+_zstd_contexts = threading.local()
+
+
+def encode_result(result: ProcessingResult) -> bytes:
+    """
+    Serialize a result for storage, compressing it when large.
+
+    Args:
+        result: Processing result
+
+    Returns:
+        JSON bytes, or a zstd frame of them
+    """
+    payload = RESULT_ADAPTER.dump_json(result)
+    if len(payload) < RESULT_COMPRESSION_MIN_BYTES:
+        return payload
+
+    compressor = getattr(_zstd_contexts, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_contexts.compressor = zstandard.ZstdCompressor(
+            level=RESULT_COMPRESSION_LEVEL
+        )
+    return compressor.compress(payload)
+
+
+def decode_result(payload: Optional[bytes]) -> Optional[bytes]:
+    """
+    Turn a stored result back into JSON bytes.
+
+    Args:
+        payload: Raw stored value (compressed or plain), or None
+
+    Returns:
+        Result JSON bytes, or None if payload is empty
+    """
+    if not payload:
+        return None
+    if not payload.startswith(ZSTD_FRAME_MAGIC):
+        return payload
+
+    decompressor = getattr(_zstd_contexts, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_contexts.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(payload)
+
+
+# Seconds a caller waits for a free pooled connection before erroring
+POOL_WAIT_TIMEOUT_SECONDS = 20
+
+# Client-side read timeout margin over the stream BLOCK time, so a blocked
+# XREADGROUP is never cut off by its own socket timeout
+STREAM_READ_TIMEOUT_MARGIN_SECONDS = 5
+
+# Idle connections are PINGed before reuse after this many seconds
+HEALTH_CHECK_INTERVAL_SECONDS = 30
+
+# TCP keepalive probing for pooled connections (options missing on the
+# current platform are skipped): start after 60s idle, probe every 10s,
+# drop after 3 unanswered probes
+KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
 
 
 class RedisClient:
@@ -31,21 +123,58 @@ class RedisClient:
     - Stream: pdf-jobs (job queue)
     - Hash: job:{job_id} (job metadata)
     - String: result:{job_id} (processing results)
+    - String: digest:{parser}:{sha256} (duplicate upload detection)
     """
 
     def __init__(self):
         """
         Initialize Redis connection.
 
+        All commands share one connection pool, so connections are reused
+        across requests and threads instead of being opened per call. The
+        pool blocks callers once redis_max_connections are checked out
+        rather than failing, and keeps idle connections alive with TCP
+        keepalive and periodic health checks.
+
         Raises:
             RedisError: If connection to Redis fails.
         """
         try:
-            self.client = redis.from_url(
+            self.pool = redis.BlockingConnectionPool.from_url(
                 settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                timeout=POOL_WAIT_TIMEOUT_SECONDS,
                 decode_responses=True,
-                socket_connect_timeout=5
+                socket_connect_timeout=5,
+                socket_keepalive=True,
+                socket_keepalive_options=KEEPALIVE_OPTIONS,
+                health_check_interval=HEALTH_CHECK_INTERVAL_SECONDS
             )
+            self.client = redis.Redis(connection_pool=self.pool)
+
+            # Blocking stream reads get their own connection, with a read
+            # timeout just above the BLOCK time, so they never tie up a
+            # pooled connection and can be interrupted on shutdown. Its
+            # replies stay binary: message IDs only travel back to XACK, so
+            # just the job fields are decoded.
+            block_seconds = settings.worker_block_time_ms / 1000
+            self.reader_pool = redis.ConnectionPool.from_url(
+                settings.redis_url,
+                decode_responses=False,
+                socket_connect_timeout=5,
+                socket_timeout=(
+                    block_seconds + STREAM_READ_TIMEOUT_MARGIN_SECONDS
+                    if block_seconds else None
+                ),
+                socket_keepalive=True,
+                socket_keepalive_options=KEEPALIVE_OPTIONS
+            )
+            self._stream_reader: Optional[redis.Redis] = None
+
+            # Fixed parts of the XREADGROUP command, built once
+            self._xreadgroup_prefix = ("XREADGROUP", "GROUP", settings.redis_consumer_group)
+            self._xreadgroup_suffix = ("STREAMS", settings.redis_stream_name, ">")
+
             # Test connection
             self.client.ping()
             logger.info(f"Connected to Redis at {settings.redis_url}")
@@ -55,36 +184,6 @@ class RedisClient:
 
     # ========== Stream Operations (Job Queue) ==========
 
-    def add_job_to_stream(self, job_id: str, filename: str, parser: ParserType) -> str:
-        """
-        Add a new job to the processing queue (Redis Stream).
-
-        Args:
-            job_id: Unique identifier for the job
-            filename: Name of the uploaded PDF file
-            parser: Parser type to use for processing
-
-        Returns:
-            Stream message ID
-
-        Raises:
-            RedisError: If stream operation fails
-        """
-        try:
-            message_id = self.client.xadd(
-                settings.redis_stream_name,
-                {
-                    "job_id": job_id,
-                    "filename": filename,
-                    "parser": parser.value
-                }
-            )
-            logger.info(f"Added job {job_id} to stream with message ID {message_id}")
-            return message_id
-        except RedisError as e:
-            logger.error(f"Failed to add job {job_id} to stream: {e}")
-            raise
-
     def create_consumer_group(self) -> None:
         """
         Create consumer group for the worker pool.
@@ -106,53 +205,92 @@ class RedisClient:
             else:
                 raise
 
+    def _get_stream_reader(self) -> redis.Redis:
+        """
+        Get the dedicated single-connection client for blocking reads.
+
+        Replies are not decoded, and XREADGROUP replies are returned raw,
+        since read_jobs_from_stream() parses them directly into job
+        dictionaries.
+        """
+        if self._stream_reader is None:
+            reader = redis.Redis(
+                connection_pool=self.reader_pool,
+                single_connection_client=True
+            )
+            reader.set_response_callback("XREADGROUP", lambda response, **options: response)
+            self._stream_reader = reader
+        return self._stream_reader
+
+    def interrupt_stream_read(self) -> None:
+        """
+        Abort a blocking read_jobs_from_stream() call in progress.
+
+        Closes the reader's socket so the blocked XREADGROUP fails with a
+        connection error right away. Takes no locks, so it is safe to call
+        from a signal handler; the next read reconnects.
+        """
+        reader = self._stream_reader
+        if reader is not None and reader.connection is not None:
+            reader.connection.disconnect()
+
     def read_jobs_from_stream(
         self,
         consumer_name: str,
         count: int = 1,
-        block_ms: int = 5000
+        block_ms: int = 30000,
+        noack: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Read jobs from stream using consumer group (blocking).
 
         This is the main method used by workers to consume jobs from the queue.
-        It blocks until jobs are available or timeout is reached.
+        It blocks until jobs are available or timeout is reached. Because
+        XREADGROUP returns as soon as a message arrives, a long block acts
+        like a push subscription without adding latency.
 
         Args:
             consumer_name: Unique name for this consumer
             count: Number of messages to read at once
-            block_ms: Time to block waiting for messages (milliseconds)
+            block_ms: Time to block waiting for messages (milliseconds);
+                should not exceed settings.worker_block_time_ms, which sizes
+                the reader's socket timeout
+            noack: Read with NOACK, so messages are never added to the
+                pending list and need no acknowledgement
 
         Returns:
-            List of job dictionaries with 'message_id', 'job_id', 'filename', 'parser'
+            List of job dictionaries with 'message_id' (bytes, to be passed
+            back to acknowledge_jobs() as-is), 'job_id', 'filename',
+            'parser' and 'timestamp' (None for messages queued before the
+            timestamp was added to the payload)
 
         Raises:
             RedisError: If stream read operation fails
         """
         try:
-            # XREADGROUP: Read from stream as part of consumer group
-            # Format: {stream_name: [(message_id, {field: value, ...}), ...]}
-            streams = self.client.xreadgroup(
-                groupname=settings.redis_consumer_group,
-                consumername=consumer_name,
-                streams={settings.redis_stream_name: '>'},
-                count=count,
-                block=block_ms
+            # XREADGROUP: Read from stream as part of consumer group.
+            # The command is sent directly and its raw reply parsed in one
+            # pass, skipping redis-py's argument building and reply parsing.
+            # Raw format: [[stream_name, [[message_id, [field, value, ...]], ...]]]
+            # with every element as bytes
+            streams = self._get_stream_reader().execute_command(
+                *self._xreadgroup_prefix,
+                consumer_name,
+                "COUNT", count,
+                "BLOCK", block_ms,
+                *(("NOACK",) if noack else ()),
+                *self._xreadgroup_suffix
             )
 
             if not streams:
                 return []
 
-            # Parse stream response
-            jobs = []
-            for stream_name, messages in streams:
-                for message_id, data in messages:
-                    jobs.append({
-                        "message_id": message_id,
-                        "job_id": data.get("job_id"),
-                        "filename": data.get("filename"),
-                        "parser": data.get("parser")
-                    })
+            # Parse stream response (a single stream is read)
+            jobs = [
+                self._job_from_message(message_id, dict(zip(fields[::2], fields[1::2])))
+                for message_id, fields in streams[0][1]
+                if fields
+            ]
 
             logger.debug(f"Read {len(jobs)} job(s) from stream")
             return jobs
@@ -161,70 +299,128 @@ class RedisClient:
             logger.error(f"Failed to read from stream: {e}")
             raise
 
-    def acknowledge_job(self, message_id: str) -> None:
+    def autoclaim_idle(
+        self,
+        consumer_name: str,
+        min_idle_ms: int = 600000,
+        count: int = 100,
+        start_id: Union[str, bytes] = "0-0"
+    ) -> Tuple[Union[str, bytes], List[Dict[str, Any]]]:
         """
-        Acknowledge job completion (XACK).
+        Claim jobs left pending by consumers that stopped (XAUTOCLAIM).
 
-        This removes the message from the consumer's pending list after
-        successful processing.
+        A message read by a worker that died before acknowledging it stays
+        in the group's pending list forever. XAUTOCLAIM reassigns pending
+        messages idle for at least min_idle_ms to this consumer in a single
+        server-side pass, so they are processed again. Each sweep resumes
+        from the cursor the previous one returned, so a pending list longer
+        than count is walked in full across sweeps.
 
         Args:
-            message_id: Stream message ID to acknowledge
+            consumer_name: Consumer that takes over the messages
+            min_idle_ms: Minimum idle time of a message to claim it; must
+                exceed the longest job, or running jobs are claimed too
+            count: Maximum number of messages to claim
+            start_id: Cursor to resume from ("0-0" starts a new pass)
+
+        Returns:
+            Tuple of (cursor for the next sweep, claimed jobs). Jobs are in
+            the same format as read_jobs_from_stream(), plus 'deliveries':
+            how many times the message has been delivered, this claim
+            included.
 
         Raises:
-            RedisError: If acknowledgment fails
+            RedisError: If the claim fails
         """
         try:
-            self.client.xack(
+            # Claimed from the stream reader so message IDs come back as
+            # bytes, like those from read_jobs_from_stream()
+            # Reply: [next_start_id, [(message_id, {field: value}), ...], ...]
+            reply = self._get_stream_reader().xautoclaim(
                 settings.redis_stream_name,
                 settings.redis_consumer_group,
-                message_id
+                consumer_name,
+                min_idle_time=min_idle_ms,
+                start_id=start_id,
+                count=count
             )
-            logger.debug(f"Acknowledged message {message_id}")
+            next_id = reply[0]
+            jobs = [
+                self._job_from_message(message_id, data)
+                for message_id, data in reply[1]
+                if data
+            ]
+            if not jobs:
+                return next_id, []
+
+            # XAUTOCLAIM does not report delivery counts; look them up in
+            # one pipelined round-trip of single-entry XPENDING ranges
+            pipe = self.client.pipeline(transaction=False)
+            for job in jobs:
+                pipe.xpending_range(
+                    settings.redis_stream_name,
+                    settings.redis_consumer_group,
+                    min=job["message_id"],
+                    max=job["message_id"],
+                    count=1
+                )
+            for job, pending in zip(jobs, pipe.execute()):
+                job["deliveries"] = pending[0]["times_delivered"] if pending else 1
+
+            logger.info(f"Claimed {len(jobs)} idle pending job(s)")
+            return next_id, jobs
         except RedisError as e:
-            logger.error(f"Failed to acknowledge message {message_id}: {e}")
+            logger.error(f"Failed to claim idle pending jobs: {e}")
             raise
 
-    # ========== Hash Operations (Job Metadata) ==========
+    @staticmethod
+    def _job_from_message(message_id: bytes, data: Dict[bytes, bytes]) -> Dict[str, Any]:
+        """
+        Convert a binary stream message to the job dictionary workers consume.
 
-    def create_job_hash(
-        self,
-        job_id: str,
-        filename: str,
-        parser: ParserType,
-        status: JobStatus = JobStatus.PENDING
-    ) -> None:
+        Job fields are decoded to str; the message ID is kept as bytes.
+        """
+        def field(name: bytes) -> Optional[str]:
+            value = data.get(name)
+            return value.decode() if value is not None else None
+
+        return {
+            "message_id": message_id,
+            "job_id": field(b"job_id"),
+            "filename": field(b"filename"),
+            "parser": field(b"parser"),
+            "timestamp": field(b"timestamp")
+        }
+
+    def acknowledge_jobs(self, message_ids: List[Union[str, bytes]]) -> None:
         """
-        Create job metadata hash (job:{job_id}).
+        Acknowledge several jobs with a single XACK.
 
-        This is the single source of truth for job status and metadata.
+        XACK is variadic, so a whole batch of processed messages is
+        removed from the pending list in one round-trip.
 
         Args:
-            job_id: Unique identifier for the job
-            filename: Name of the uploaded PDF file
-            parser: Parser type to use
-            status: Initial job status (default: PENDING)
+            message_ids: Stream message IDs to acknowledge
 
         Raises:
-            RedisError: If hash creation fails
+            RedisError: If acknowledgment fails
         """
+        if not message_ids:
+            return
+
         try:
-            key = f"job:{job_id}"
-            self.client.hset(
-                key,
-                mapping={
-                    "status": status.value,
-                    "filename": filename,
-                    "parser": parser.value,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "error": ""
-                }
+            self.client.xack(
+                settings.redis_stream_name,
+                settings.redis_consumer_group,
+                *message_ids
             )
-            logger.info(f"Created job hash for {job_id}")
+            logger.debug(f"Acknowledged {len(message_ids)} message(s)")
         except RedisError as e:
-            logger.error(f"Failed to create job hash for {job_id}: {e}")
+            logger.error(f"Failed to acknowledge {len(message_ids)} message(s): {e}")
             raise
 
+    # ========== Hash Operations (Job Metadata) ==========
+
     def get_job_status(self, job_id: str) -> Optional[Dict[str, str]]:
         """
         Get job metadata from hash.
@@ -251,11 +447,36 @@ class RedisClient:
             logger.error(f"Failed to get job status for {job_id}: {e}")
             raise
 
+    def get_job_fields(self, job_id: str, *fields: str) -> Dict[str, Optional[str]]:
+        """
+        Get selected fields of a job hash (HMGET).
+
+        Cheaper than get_job_status when only a few fields are needed,
+        since only the requested values come back over the wire.
+
+        Args:
+            job_id: Unique identifier for the job
+            *fields: Hash fields to read
+
+        Returns:
+            Dictionary mapping each field to its value (None if missing)
+
+        Raises:
+            RedisError: If hash read fails
+        """
+        try:
+            values = self.client.hmget(f"job:{job_id}", fields)
+            return dict(zip(fields, values))
+        except RedisError as e:
+            logger.error(f"Failed to get fields {fields} for job {job_id}: {e}")
+            raise
+
     def update_job_status(
         self,
         job_id: str,
         status: JobStatus,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        extra: Optional[Dict[str, str]] = None
     ) -> None:
         """
         Update job status in hash.
@@ -264,16 +485,19 @@ class RedisClient:
             job_id: Unique identifier for the job
             status: New job status
             error: Optional error message (for FAILED status)
+            extra: Optional additional fields written in the same HSET
 
         Raises:
             RedisError: If hash update fails
         """
         try:
             key = f"job:{job_id}"
-            updates = {"status": status.value}
+            updates = {"status": STATUS_VALUE[status]}
 
             if error:
                 updates["error"] = error
+            if extra:
+                updates.update(extra)
 
             self.client.hset(key, mapping=updates)
             logger.info(f"Updated job {job_id} status to {status.value}")
@@ -285,7 +509,9 @@ class RedisClient:
         """
         Get all job metadata from Redis.
 
-        Scans for all job:* keys and retrieves their metadata.
+        Walks the job index with SSCAN and fetches each batch of hashes
+        with a single pipelined round-trip, so the cost grows with the
+        number of jobs rather than the size of the keyspace.
 
         Returns:
             List of job metadata dictionaries
@@ -295,13 +521,15 @@ class RedisClient:
         """
         try:
             jobs = []
-            # Use SCAN to iterate through keys safely
-            for key in self.client.scan_iter(match="job:*", count=100):
-                job_data = self.client.hgetall(key)
-                if job_data:
-                    job_id = key.split(":", 1)[1]
-                    job_data["job_id"] = job_id
-                    jobs.append(job_data)
+            batch = []
+
+            for job_id in self.client.sscan_iter(JOB_INDEX_KEY, count=JOB_SCAN_BATCH_SIZE):
+                batch.append(job_id)
+                if len(batch) >= JOB_SCAN_BATCH_SIZE:
+                    jobs.extend(self._get_job_hashes(batch))
+                    batch = []
+            if batch:
+                jobs.extend(self._get_job_hashes(batch))
 
             logger.debug(f"Retrieved {len(jobs)} jobs")
             return jobs
@@ -309,73 +537,268 @@ class RedisClient:
             logger.error(f"Failed to get all jobs: {e}")
             raise
 
+    def _get_job_hashes(self, job_ids: List[str]) -> List[Dict[str, str]]:
+        """
+        Fetch several job hashes in one pipelined round-trip.
+
+        IDs whose hash no longer exists are dropped from the job index.
+
+        Args:
+            job_ids: IDs of the jobs to fetch
+
+        Returns:
+            Job metadata dictionaries with 'job_id' set, skipping jobs
+            that no longer exist
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hgetall(f"job:{job_id}")
+
+        jobs = []
+        missing = []
+        for job_id, job_data in zip(job_ids, pipe.execute()):
+            if job_data:
+                job_data["job_id"] = job_id
+                jobs.append(job_data)
+            else:
+                missing.append(job_id)
+
+        if missing:
+            self.client.srem(JOB_INDEX_KEY, *missing)
+        return jobs
+
+    def rebuild_job_index(self) -> int:
+        """
+        Add every existing job hash to the job index, once.
+
+        Only needed for jobs created before the index existed; this is the
+        one place that still scans the keyspace. The first caller claims a
+        marker key with SET NX, so later startups (of any process) skip the
+        scan entirely.
+
+        Returns:
+            Number of job IDs added to the index (0 if already backfilled)
+
+        Raises:
+            RedisError: If the scan fails
+        """
+        try:
+            if not self.client.set(JOB_INDEX_BUILT_KEY, 1, nx=True):
+                logger.debug("Job index already backfilled, skipping scan")
+                return 0
+
+            added = 0
+            batch = []
+            for key in self.client.scan_iter(match="job:*", count=JOB_SCAN_BATCH_SIZE):
+                batch.append(key.split(":", 1)[1])
+                if len(batch) >= JOB_SCAN_BATCH_SIZE:
+                    added += self.client.sadd(JOB_INDEX_KEY, *batch)
+                    batch = []
+            if batch:
+                added += self.client.sadd(JOB_INDEX_KEY, *batch)
+
+            if added:
+                logger.info(f"Added {added} existing job(s) to the job index")
+            return added
+        except RedisError as e:
+            logger.error(f"Failed to rebuild job index: {e}")
+            # Let a later startup retry the backfill
+            try:
+                self.client.delete(JOB_INDEX_BUILT_KEY)
+            except RedisError:
+                pass
+            raise
+
     # ========== String Operations (Processing Results) ==========
 
-    def store_result(self, result: ProcessingResult) -> None:
+    def finalize_job(self, result: ProcessingResult) -> None:
         """
-        Store processing result (result:{job_id}).
+        Store a job's final result and status in a single round-trip.
 
-        The result is stored as a JSON string with a TTL to prevent
-        unbounded growth of result data.
+        The result string and the hash's status (plus error, if any) are
+        written in one MULTI/EXEC pipeline, so a job is never marked
+        finished without its result, and the worker pays one RTT instead
+        of two.
 
         Args:
-            result: Complete processing result
+            result: Final processing result (COMPLETED or FAILED)
 
         Raises:
-            RedisError: If result storage fails
+            RedisError: If the pipeline fails
         """
         try:
-            key = f"result:{result.job_id}"
-            result_json = result.model_dump_json()
+            updates = {"status": STATUS_VALUE[result.status]}
+            if result.error:
+                updates["error"] = result.error
 
-            # Store with TTL
-            self.client.setex(
-                key,
+            pipe = self.client.pipeline()
+            pipe.setex(
+                f"result:{result.job_id}",
                 settings.redis_result_ttl_seconds,
-                result_json
+                encode_result(result)
             )
+            pipe.hset(f"job:{result.job_id}", mapping=updates)
+            pipe.execute()
             logger.info(
-                f"Stored result for job {result.job_id} "
-                f"(TTL: {settings.redis_result_ttl_seconds}s)"
+                f"Finalized job {result.job_id} as {result.status.value} "
+                f"(result TTL: {settings.redis_result_ttl_seconds}s)"
             )
         except RedisError as e:
-            logger.error(f"Failed to store result for {result.job_id}: {e}")
+            logger.error(f"Failed to finalize job {result.job_id}: {e}")
             raise
 
-    def get_result(self, job_id: str) -> Optional[ProcessingResult]:
+    def get_status_and_result(
+        self,
+        job_id: str
+    ) -> Tuple[Optional[Dict[str, str]], Optional[bytes]]:
         """
-        Get processing result from Redis.
+        Get job status and raw result JSON in a single round-trip.
+
+        Both keys are read in one pipeline, so result polling costs one
+        RTT instead of two. Only the 'status' and 'error' fields of the job
+        hash are fetched (HMGET). The result is fetched even for unfinished
+        jobs; it is simply absent in that case.
 
         Args:
             job_id: Unique identifier for the job
 
         Returns:
-            ProcessingResult object, or None if result doesn't exist or expired
+            Tuple of (dict with 'status' and 'error', or None if the job
+            doesn't exist; result JSON bytes or None)
 
         Raises:
-            RedisError: If result retrieval fails
+            RedisError: If the pipeline fails
         """
         try:
-            key = f"result:{job_id}"
-            result_json = self.client.get(key)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hmget(f"job:{job_id}", "status", "error")
+            pipe.execute_command("GET", f"result:{job_id}", **{NEVER_DECODE: True})
+            (status, error), stored_result = pipe.execute()
 
-            if not result_json:
-                logger.warning(f"Result for job {job_id} not found or expired")
-                return None
+            job_data = {"status": status, "error": error} if status else None
+            return job_data, decode_result(stored_result)
+        except RedisError as e:
+            logger.error(f"Failed to get status and result for {job_id}: {e}")
+            raise
+
+    # ========== Batch Operations (Uploads) ==========
+
+    def enqueue_jobs(self, jobs: List[Dict[str, str]], parser: ParserType) -> None:
+        """
+        Create and queue a batch of jobs in a single round-trip.
 
-            return ProcessingResult.model_validate_json(result_json)
+        For each job this writes the metadata hash, indexes the job ID,
+        adds the job to the stream and records the upload's content
+        digest, all inside one MULTI/EXEC pipeline so a failed batch
+        leaves nothing half-queued.
+
+        Args:
+            jobs: Job dictionaries with 'job_id', 'filename', 'digest',
+                'status' and 'timestamp'
+            parser: Parser type to use for processing
+
+        Raises:
+            RedisError: If the pipeline fails
+        """
+        if not jobs:
+            return
+
+        try:
+            parser_value = PARSER_VALUE[parser]
+            pipe = self.client.pipeline()
+            for job in jobs:
+                pipe.hset(
+                    f"job:{job['job_id']}",
+                    mapping={
+                        "job_id": job["job_id"],
+                        "status": job["status"],
+                        "filename": job["filename"],
+                        "parser": parser_value,
+                        "timestamp": job["timestamp"],
+                        "error": ""
+                    }
+                )
+                pipe.sadd(JOB_INDEX_KEY, job["job_id"])
+                pipe.xadd(
+                    settings.redis_stream_name,
+                    {
+                        "job_id": job["job_id"],
+                        "filename": job["filename"],
+                        "parser": parser_value,
+                        "timestamp": job["timestamp"]
+                    }
+                )
+                # Digest mapping shares the result TTL so it never outlives the result
+                pipe.setex(
+                    f"digest:{parser_value}:{job['digest']}",
+                    settings.redis_result_ttl_seconds,
+                    job["job_id"]
+                )
+            pipe.execute()
+            logger.info(f"Queued {len(jobs)} job(s) in one pipeline")
         except RedisError as e:
-            logger.error(f"Failed to get result for {job_id}: {e}")
+            logger.error(f"Failed to queue {len(jobs)} job(s): {e}")
             raise
-        except Exception as e:
-            logger.error(f"Failed to parse result for {job_id}: {e}")
+
+    def find_jobs_by_digest(
+        self,
+        digests: List[str],
+        parser: ParserType
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        Find reusable jobs for previously uploaded content.
+
+        Digest lookups are pipelined, and job hashes are only fetched
+        (again pipelined) when at least one digest matched. Failed jobs
+        are never reused so that re-uploading retries them.
+
+        Args:
+            digests: Hex SHA-256 digests of the uploaded files
+            parser: Parser type requested for the upload
+
+        Returns:
+            List aligned with digests, holding job metadata (including
+            'job_id') for matches and None otherwise
+
+        Raises:
+            RedisError: If the lookup fails
+        """
+        if not digests:
+            return []
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for digest in digests:
+                pipe.get(f"digest:{PARSER_VALUE[parser]}:{digest}")
+            job_ids = pipe.execute()
+
+            found = [job_id for job_id in job_ids if job_id]
+            if not found:
+                return [None] * len(digests)
+
+            pipe = self.client.pipeline(transaction=False)
+            for job_id in found:
+                pipe.hgetall(f"job:{job_id}")
+            jobs_by_id = dict(zip(found, pipe.execute()))
+
+            matches = []
+            for job_id in job_ids:
+                job_data = jobs_by_id.get(job_id) if job_id else None
+                if not job_data or job_data.get("status") == JobStatus.FAILED.value:
+                    matches.append(None)
+                else:
+                    matches.append({**job_data, "job_id": job_id})
+            return matches
+        except RedisError as e:
+            logger.error(f"Failed to look up {len(digests)} digest(s): {e}")
             raise
 
     # ========== Utility Methods ==========
 
     def delete_job(self, job_id: str) -> None:
         """
-        Delete job metadata and result from Redis.
+        Delete job metadata and result from Redis, and drop the job
+        from the job index.
 
         This is useful for cleanup operations.
 
@@ -386,12 +809,23 @@ class RedisClient:
             RedisError: If deletion fails
         """
         try:
-            self.client.delete(f"job:{job_id}", f"result:{job_id}")
+            pipe = self.client.pipeline()
+            pipe.delete(f"job:{job_id}", f"result:{job_id}")
+            pipe.srem(JOB_INDEX_KEY, job_id)
+            pipe.execute()
             logger.info(f"Deleted job {job_id} and its result")
         except RedisError as e:
             logger.error(f"Failed to delete job {job_id}: {e}")
             raise
 
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if self._stream_reader is not None:
+            self._stream_reader.close()
+        self.reader_pool.disconnect()
+        self.pool.disconnect()
+        logger.info("Closed Redis connection pool")
+
     def health_check(self) -> bool:
         """
         Check Redis connection health.
@@ -413,7 +847,10 @@ def get_redis_client() -> RedisClient:
     """
     Get global Redis client instance.
 
-    This ensures a single Redis connection is reused across the application.
+    This ensures a single Redis connection pool is reused across the
+    application. The client is created on first use, so importing a module
+    never connects, and a forked child builds its own instead of sharing
+    the parent's sockets.
 
     Returns:
         RedisClient instance
@@ -422,3 +859,12 @@ def get_redis_client() -> RedisClient:
     if _redis_client is None:
         _redis_client = RedisClient()
     return _redis_client
+
+
+def _reset_redis_client_after_fork() -> None:
+    """Drop the inherited client in a forked child without closing its sockets."""
+    global _redis_client
+    _redis_client = None
+
+
+os.register_at_fork(after_in_child=_reset_redis_client_after_fork)
@@ -2,22 +2,27 @@
 Async worker for processing PDF jobs.
 
 This worker:
-1. Consumes jobs from Redis Stream (XREADGROUP)
-2. Processes PDFs using the appropriate parser
+1. Consumes jobs from Redis Stream (XREADGROUP), periodically claiming
+   jobs left pending by dead workers (XAUTOCLAIM)
+2. Processes up to WORKER_CONCURRENCY PDFs at once on a thread pool
 3. Stores results in Redis
 4. Updates job status
-5. Acknowledges processed messages
+5. Acknowledges completed messages, one XACK per loop pass (unless
+   jobs are read with NOACK)
 """
 
 import logging
+import os
+import socket
 import time
 import signal
 import sys
-from pathlib import Path
-from datetime import datetime
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
 
-from .models import JobStatus, ParserType, ProcessingResult
-from .config import get_settings
+from .models import JobStatus, ProcessingResult, PARSER_BY_VALUE
+from .config import settings
 from .redis_client import get_redis_client
 from .parsers import get_parser, validate_pdf
 
@@ -28,63 +33,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize settings and Redis client
-settings = get_settings()
-redis_client = get_redis_client()
+# Stream read block time while jobs are in flight, so completed jobs are
+# acknowledged (and their slots refilled) without waiting out a full block
+IN_FLIGHT_BLOCK_MS = 1000
 
-# Global flag for graceful shutdown
-shutdown_flag = False
+# Set on shutdown; waiting on it doubles as an interruptible sleep
+shutdown_event = threading.Event()
 
 
 def signal_handler(signum, frame):
     """
     Handle shutdown signals gracefully.
 
-    This allows the worker to finish processing the current job
-    before exiting.
+    This allows the worker to finish the jobs already in flight
+    before exiting. A blocking stream read is interrupted so an idle
+    worker exits immediately instead of waiting out the block time.
     """
-    global shutdown_flag
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-    shutdown_flag = True
+    shutdown_event.set()
+    get_redis_client().interrupt_stream_read()
 
 
-# Register signal handlers
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
+def get_job_timestamp(job_data: dict) -> str:
+    """
+    Get a job's creation timestamp.
+
+    The timestamp is carried in the stream message; only messages queued
+    before it was added to the payload need a read of the job hash.
 
+    Args:
+        job_data: Job information from Redis Stream
 
-def process_job(job_data: dict) -> None:
+    Returns:
+        ISO 8601 creation timestamp (now, if the job has none)
+    """
+    if job_data.get("timestamp"):
+        return job_data["timestamp"]
+
+    fields = get_redis_client().get_job_fields(job_data["job_id"], "timestamp")
+    return fields["timestamp"] or datetime.now(timezone.utc).isoformat()
+
+
+def process_job(job_data: dict, worker_name: str) -> None:
     """
     Process a single PDF job.
 
     This is the core processing function that:
-    1. Updates status to PROCESSING
-    2. Loads the PDF file
+    1. Checks the PDF file (a local check, so a missing or invalid file
+       costs no PROCESSING round-trip)
+    2. Updates status to PROCESSING, recording the worker and start time
     3. Runs the appropriate parser
     4. Stores the result
     5. Updates status to COMPLETED or FAILED
 
+    Runs on a worker thread. The stream message is not acknowledged
+    here; run_worker acknowledges completed messages together.
+
     Args:
         job_data: Job information from Redis Stream
+        worker_name: Name of the worker processing the job
     """
     job_id = job_data["job_id"]
     filename = job_data["filename"]
     parser_type = job_data["parser"]
-    message_id = job_data["message_id"]
 
     logger.info(f"Processing job {job_id} ({filename}) with {parser_type} parser")
     start_time = time.time()
+    redis_client = get_redis_client()
 
     try:
-        # Update status to PROCESSING
-        redis_client.update_job_status(job_id, JobStatus.PROCESSING)
-
         # Construct PDF path
-        pdf_path = Path(settings.upload_dir) / f"{job_id}.pdf"
+        pdf_path = settings.upload_path / f"{job_id}.pdf"
 
-        # Validate PDF exists
-        if not validate_pdf(str(pdf_path)):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        # Validate the PDF exists and is well-formed; raises
+        # FileNotFoundError or ValueError with the reason
+        validate_pdf(str(pdf_path))
+
+        # Update status to PROCESSING, with who is running it since when
+        redis_client.update_job_status(
+            job_id,
+            JobStatus.PROCESSING,
+            extra={
+                "worker": worker_name,
+                "started_at": datetime.now(timezone.utc).isoformat()
+            }
+        )
 
         # Get appropriate parser
         parser = get_parser(parser_type)
@@ -96,28 +129,21 @@ def process_job(job_data: dict) -> None:
         # Calculate processing time
         processing_time = time.time() - start_time
 
-        # Get job metadata for timestamp
-        job_metadata = redis_client.get_job_status(job_id)
-        timestamp = job_metadata.get("timestamp", datetime.utcnow().isoformat())
-
         # Create result object
         result = ProcessingResult(
             job_id=job_id,
             status=JobStatus.COMPLETED,
             filename=filename,
-            parser=ParserType(parser_type),
+            parser=PARSER_BY_VALUE[parser_type],
             pages=pages,
             summary=summary,
             error=None,
-            timestamp=timestamp,
+            timestamp=get_job_timestamp(job_data),
             processing_time_seconds=round(processing_time, 2)
         )
 
-        # Store result in Redis
-        redis_client.store_result(result)
-
-        # Update job status to COMPLETED
-        redis_client.update_job_status(job_id, JobStatus.COMPLETED)
+        # Store result and mark the job COMPLETED in one round-trip
+        redis_client.finalize_job(result)
 
         logger.info(
             f"Successfully processed job {job_id} in {processing_time:.2f}s "
@@ -136,56 +162,123 @@ def process_job(job_data: dict) -> None:
         # Log the error
         logger.error(f"Failed to process job {job_id}: {e}", exc_info=True)
 
-        # Update job status to FAILED with error message
-        error_message = f"{type(e).__name__}: {str(e)}"
+        fail_job(
+            job_data,
+            f"{type(e).__name__}: {str(e)}",
+            processing_time=time.time() - start_time
+        )
+
+
+def fail_job(job_data: dict, error_message: str, processing_time: float = 0.0) -> None:
+    """
+    Store a failed result and mark the job FAILED in one round-trip.
+
+    If the result cannot be stored, the failure is still recorded on the
+    job hash itself.
+
+    Args:
+        job_data: Job information from Redis Stream
+        error_message: Error to report for the job
+        processing_time: Seconds spent on the job before it failed
+
+    Raises:
+        RedisError: If the failure cannot be recorded at all
+    """
+    job_id = job_data["job_id"]
+    redis_client = get_redis_client()
+    try:
+        failed_result = ProcessingResult(
+            job_id=job_id,
+            status=JobStatus.FAILED,
+            filename=job_data["filename"],
+            parser=PARSER_BY_VALUE[job_data["parser"]],
+            pages=[],
+            summary=None,
+            error=error_message,
+            timestamp=get_job_timestamp(job_data),
+            processing_time_seconds=round(processing_time, 2)
+        )
+        redis_client.finalize_job(failed_result)
+    except Exception as result_error:
+        logger.error(f"Failed to store error result for job {job_id}: {result_error}")
+        # Still record the failure on the job itself
         redis_client.update_job_status(
             job_id,
             JobStatus.FAILED,
             error=error_message
         )
 
-        # Create failed result for consistency
-        try:
-            job_metadata = redis_client.get_job_status(job_id)
-            timestamp = job_metadata.get("timestamp", datetime.utcnow().isoformat())
-
-            failed_result = ProcessingResult(
-                job_id=job_id,
-                status=JobStatus.FAILED,
-                filename=filename,
-                parser=ParserType(parser_type),
-                pages=[],
-                summary=None,
-                error=error_message,
-                timestamp=timestamp,
-                processing_time_seconds=round(time.time() - start_time, 2)
-            )
-            redis_client.store_result(failed_result)
-        except Exception as result_error:
-            logger.error(f"Failed to store error result for job {job_id}: {result_error}")
-
-    finally:
-        # Always acknowledge the message to remove it from pending list
-        try:
-            redis_client.acknowledge_job(message_id)
-            logger.debug(f"Acknowledged message {message_id} for job {job_id}")
-        except Exception as ack_error:
-            logger.error(f"Failed to acknowledge message {message_id}: {ack_error}")
+
+def abandon_job(job_data: dict) -> bool:
+    """
+    Fail a reclaimed job that has been delivered too many times.
+
+    Args:
+        job_data: Claimed job information, including 'deliveries'
+
+    Returns:
+        True if the job was marked FAILED and its message can be
+        acknowledged; False if that failed, leaving it pending
+    """
+    job_id = job_data["job_id"]
+    error_message = (
+        f"Abandoned after {job_data['deliveries'] - 1} delivery attempts; "
+        f"the worker stopped while processing it each time"
+    )
+    logger.error(f"Job {job_id}: {error_message}")
+    try:
+        fail_job(job_data, error_message)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to mark abandoned job {job_id} as failed: {e}")
+        return False
+
+
+def acknowledge_batch(message_ids: list) -> None:
+    """
+    Acknowledge processed messages to remove them from the pending list.
+
+    Failures are logged rather than raised so the worker keeps running;
+    unacknowledged messages simply stay pending.
+
+    Args:
+        message_ids: Stream message IDs of processed jobs; None entries
+            (jobs read with NOACK, which were never pending) are skipped
+    """
+    message_ids = [message_id for message_id in message_ids if message_id is not None]
+    try:
+        get_redis_client().acknowledge_jobs(message_ids)
+    except Exception as ack_error:
+        logger.error(f"Failed to acknowledge messages {message_ids}: {ack_error}")
 
 
 def run_worker(worker_name: str = None):
     """
     Main worker loop.
 
-    Continuously reads jobs from Redis Stream and processes them.
+    Continuously reads jobs from Redis Stream and processes them
+    concurrently, reading only as many jobs as there are free slots.
     Runs until shutdown signal is received.
 
     Args:
-        worker_name: Optional custom worker name (default: from settings)
+        worker_name: Optional custom worker name (default: from settings,
+            else '{hostname}-{pid}')
     """
-    worker_name = worker_name or settings.redis_consumer_name
+    # Each process needs its own consumer name; processes sharing one
+    # would share a pending list and could not be told apart
+    worker_name = (
+        worker_name
+        or settings.redis_consumer_name
+        or f"{socket.gethostname()}-{os.getpid()}"
+    )
     logger.info(f"Starting worker: {worker_name}")
 
+    # Connect before any job thread starts, so all of them share the
+    # client, and before signal handlers that use it are installed
+    redis_client = get_redis_client()
+    signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGINT, signal_handler)
+
     # Ensure upload directory exists
     settings.ensure_upload_dir()
 
@@ -203,35 +296,98 @@ def run_worker(worker_name: str = None):
     # Main processing loop
     logger.info(f"Worker {worker_name} is ready and waiting for jobs...")
 
-    while not shutdown_flag:
-        try:
-            # Read jobs from stream (blocking call)
-            jobs = redis_client.read_jobs_from_stream(
-                consumer_name=worker_name,
-                count=1,  # Process one job at a time
-                block_ms=settings.worker_block_time_ms
-            )
-
-            if not jobs:
-                # No jobs available, continue waiting
-                logger.debug("No jobs available, continuing to wait...")
-                continue
-
-            # Process each job
-            for job_data in jobs:
-                if shutdown_flag:
-                    logger.info("Shutdown flag set, stopping job processing")
+    # Jobs run on a thread pool: parsing is dominated by API round-trips,
+    # so a single process can keep several documents in flight at once.
+    # Completed jobs are acknowledged together, one XACK per loop pass.
+    # future -> stream message ID to acknowledge (None if read with NOACK)
+    in_flight = {}
+    last_claim = float("-inf")
+    claim_cursor = "0-0"
+    with ThreadPoolExecutor(
+        max_workers=settings.worker_concurrency,
+        thread_name_prefix="job"
+    ) as executor:
+        while not shutdown_event.is_set():
+            try:
+                free_slots = settings.worker_concurrency - len(in_flight)
+
+                # Periodically take over jobs left pending by dead workers
+                now = time.monotonic()
+                if free_slots > 0 and now - last_claim >= settings.worker_claim_interval_seconds:
+                    last_claim = now
+                    running = set(in_flight.values())
+                    claim_cursor, claimed = redis_client.autoclaim_idle(
+                        consumer_name=worker_name,
+                        min_idle_ms=settings.worker_claim_idle_ms,
+                        count=free_slots,
+                        start_id=claim_cursor
+                    )
+                    abandoned = []
+                    for job_data in claimed:
+                        if job_data["message_id"] in running:
+                            # One of our own jobs that is still running
+                            continue
+                        if job_data["deliveries"] > settings.worker_max_deliveries:
+                            # Likely a job that kills its worker (e.g. a
+                            # crash or OOM in MuPDF); stop retrying it
+                            if abandon_job(job_data):
+                                abandoned.append(job_data["message_id"])
+                            continue
+                        future = executor.submit(process_job, job_data, worker_name)
+                        in_flight[future] = job_data["message_id"]
+                    acknowledge_batch(abandoned)
+                    free_slots = settings.worker_concurrency - len(in_flight)
+
+                if free_slots > 0:
+                    # Block for new work only when idle; with jobs in flight,
+                    # poll briefly so completions are acknowledged promptly.
+                    jobs = redis_client.read_jobs_from_stream(
+                        consumer_name=worker_name,
+                        count=free_slots,
+                        block_ms=(
+                            IN_FLIGHT_BLOCK_MS if in_flight
+                            else settings.worker_block_time_ms
+                        ),
+                        noack=settings.worker_noack
+                    )
+                    for job_data in jobs:
+                        future = executor.submit(process_job, job_data, worker_name)
+                        in_flight[future] = (
+                            None if settings.worker_noack else job_data["message_id"]
+                        )
+
+                if not in_flight:
+                    # No jobs available, continue waiting
+                    logger.debug("No jobs available, continuing to wait...")
+                    continue
+
+                # Every processed job is acknowledged, failed ones included;
+                # claimed jobs are pending even in NOACK mode, so they are too
+                done, _ = wait(
+                    in_flight,
+                    timeout=0 if free_slots > 0 else None,
+                    return_when=FIRST_COMPLETED
+                )
+                if done:
+                    acknowledge_batch([in_flight.pop(future) for future in done])
+
+            except KeyboardInterrupt:
+                logger.info("Received keyboard interrupt, shutting down...")
+                break
+            except Exception as e:
+                if shutdown_event.is_set():
+                    # Expected: the signal handler interrupted a blocking read
                     break
-
-                process_job(job_data)
-
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt, shutting down...")
-            break
-        except Exception as e:
-            logger.error(f"Error in worker loop: {e}", exc_info=True)
-            # Sleep briefly before retrying to avoid tight error loops
-            time.sleep(5)
+                logger.error(f"Error in worker loop: {e}", exc_info=True)
+                # Back off before retrying to avoid tight error loops,
+                # waking immediately if shutdown is requested meanwhile
+                shutdown_event.wait(5)
+
+        # Let jobs already started finish, then acknowledge them
+        if in_flight:
+            logger.info(f"Waiting for {len(in_flight)} in-flight job(s) to finish...")
+            wait(in_flight)
+            acknowledge_batch(list(in_flight.values()))
 
     logger.info(f"Worker {worker_name} shutting down gracefully")
 